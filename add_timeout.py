@@ -1,16 +1,62 @@
-import json
+# 타입 힌트 유지 - 파일이 아주 많을 때는 `mypyc add_timeout.py`로 네이티브 모듈로 빌드해 쓸 수 있음 (선택)
+import os
+import hashlib
 from pathlib import Path
+from typing import Any
+from concurrent.futures import ProcessPoolExecutor
 
-# 모든 n8n JSON 파일
-files = list(Path('D:/workspace/news').glob('n8n_*.json'))
+from news_store import json_loads, json_dumps
 
-for f in files:
+CacheEntry = list[Any]  # [mtime_ns, size, sha1]
+
+NEWS_DIR = Path('D:/workspace/news')
+EXECUTE_COMMAND = 'n8n-nodes-base.executeCommand'
+# 파일별 (mtime_ns, size, sha1) 캐시 - 변경 없는 파일은 다시 파싱하지 않음
+CACHE_FILE = NEWS_DIR / '.add_timeout_cache.json'
+
+
+def load_cache() -> dict[str, CacheEntry]:
+    if CACHE_FILE.exists():
+        try:
+            cache: dict[str, CacheEntry] = json_loads(CACHE_FILE.read_bytes())
+            return cache
+        except Exception:
+            pass  # 캐시 손상 시 새로 시작
+    return {}
+
+
+def save_cache(cache: dict[str, CacheEntry]) -> None:
+    tmp = CACHE_FILE.with_suffix('.tmp')
+    tmp.write_bytes(json_dumps(cache, indent=True))
+    os.replace(tmp, CACHE_FILE)
+
+
+def needs_timeout(nodes: list[dict[str, Any]]) -> bool:
+    """timeout 없는 executeCommand 노드가 하나라도 있는지 (첫 발견 시 종료)"""
+    return any(
+        node.get('type') == EXECUTE_COMMAND and 'timeout' not in node.get('parameters', {}).get('options', {})
+        for node in nodes
+    )
+
+
+def process_file(f: Path, cached_sha1: str | None = None) -> tuple[str, bool | None, list[str], CacheEntry | None]:
+    """n8n 워크플로우 파일 하나 처리 - (파일명, 수정 여부, 로그, 캐시 항목) 반환"""
+    logs: list[str] = []
     try:
-        data = json.loads(f.read_text(encoding='utf-8'))
+        buf = f.read_bytes()
+        sha1 = hashlib.sha1(buf).hexdigest()
+        if sha1 == cached_sha1:
+            # mtime만 바뀌고 내용은 동일
+            st = f.stat()
+            return f.name, False, logs, [st.st_mtime_ns, st.st_size, sha1]
+
+        data = json_loads(buf)
+        nodes = data.get('nodes', [])
         modified = False
-        
-        for node in data.get('nodes', []):
-            if node.get('type') == 'n8n-nodes-base.executeCommand':
+
+        # 대부분 이미 timeout이 있으므로 먼저 훑어보고, 필요할 때만 수정 루프 실행
+        for node in (nodes if needs_timeout(nodes) else ()):
+            if node.get('type') == EXECUTE_COMMAND:
                 params = node.get('parameters', {})
                 # timeout 없으면 추가 (1시간 = 3600000ms)
                 if 'options' not in params:
@@ -18,12 +64,53 @@ for f in files:
                 if 'timeout' not in params['options']:
                     params['options']['timeout'] = 3600000
                     modified = True
-                    print(f"  Added timeout to: {node.get('name', 'unknown')}")
-        
+                    logs.append(f"  Added timeout to: {node.get('name', 'unknown')}")
+
         if modified:
-            f.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
-            print(f"Updated: {f.name}")
-        else:
-            print(f"No change: {f.name}")
+            buf = json_dumps(data, indent=True)
+            f.write_bytes(buf)
+            sha1 = hashlib.sha1(buf).hexdigest()
+        st = f.stat()
+        return f.name, modified, logs, [st.st_mtime_ns, st.st_size, sha1]
     except Exception as e:
-        print(f"Error {f.name}: {e}")
+        logs.append(f"Error {f.name}: {e}")
+        return f.name, None, logs, None
+
+
+def main() -> None:
+    cache = load_cache()
+
+    # 모든 n8n JSON 파일 - scandir 한 번으로 목록 + stat (DirEntry가 stat 캐시)
+    # mtime/size가 캐시와 같으면 건너뜀
+    pending: list[Path] = []
+    with os.scandir(NEWS_DIR) as it:
+        for entry in it:
+            if not (entry.name.startswith('n8n_') and entry.name.endswith('.json') and entry.is_file()):
+                continue
+            f = Path(entry.path)
+            st = entry.stat()
+            cached = cache.get(str(f))
+            if cached and cached[:2] == [st.st_mtime_ns, st.st_size]:
+                print(f"No change: {f.name} (cached)")
+                continue
+            pending.append(f)
+    cached_hashes = [(cache.get(str(f)) or [None] * 3)[2] for f in pending]
+
+    # 파일별 파싱/직렬화는 CPU 작업이므로 프로세스 풀로 병렬 처리
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = ex.map(process_file, pending, cached_hashes, chunksize=8)
+        for f, (name, modified, logs, cache_entry) in zip(pending, results):
+            for line in logs:
+                print(line)
+            if modified:
+                print(f"Updated: {name}")
+            elif modified is not None:
+                print(f"No change: {name}")
+            if cache_entry:
+                cache[str(f)] = cache_entry
+
+    save_cache(cache)
+
+
+if __name__ == "__main__":
+    main()
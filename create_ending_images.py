@@ -7,18 +7,37 @@
 """
 
 import os
-import requests
+import base64
+import shutil
 from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from http_session import backoff_session
 
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 OPENAI_API_BASE = "https://api.openai.com/v1"
 
+# HTTP 세션 재사용 (keep-alive + 커넥션 풀, 429/5xx/타임아웃은 BackoffSession이 재시도)
+SESSION = backoff_session(pool_size=32)
+
 output_dir = Path("assets")
 output_dir.mkdir(exist_ok=True)
 
-def generate_image(prompt: str, output_path: Path, size: str):
+def fit_to_video(image_path: Path, target_size: tuple[int, int]):
+    """영상 해상도로 미리 리사이즈 (Lanczos) + PNG 최적화 저장
+
+    렌더링 때마다 ffmpeg가 다시 스케일하지 않도록 최종 해상도로 맞춰 둠
+    """
+    img = Image.open(image_path).convert("RGB")
+    if img.size != target_size:
+        img = img.resize(target_size, Image.LANCZOS)
+    img.save(image_path, "PNG", optimize=True)
+
+
+def generate_image(prompt: str, output_path: Path, size: str, target_size: Optional[tuple[int, int]] = None):
     """GPT Image 1.5로 이미지 생성"""
-    response = requests.post(
+    response = SESSION.post(
         f"{OPENAI_API_BASE}/images/generations",
         headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
         json={"model": "gpt-image-1.5", "prompt": prompt, "n": 1, "size": size, "quality": "high"},
@@ -32,11 +51,13 @@ def generate_image(prompt: str, output_path: Path, size: str):
     
     # url 또는 b64_json 형식 처리
     if "url" in data:
-        img_response = requests.get(data["url"], timeout=60)
-        with open(output_path, 'wb') as f:
-            f.write(img_response.content)
+        # 메모리에 전체를 올리지 않고 64KB 단위로 파일에 바로 기록
+        with SESSION.get(data["url"], stream=True, timeout=60) as img_response:
+            img_response.raise_for_status()
+            img_response.raw.decode_content = True
+            with open(output_path, 'wb') as f:
+                shutil.copyfileobj(img_response.raw, f, length=65536)
     elif "b64_json" in data:
-        import base64
         img_data = base64.b64decode(data["b64_json"])
         with open(output_path, 'wb') as f:
             f.write(img_data)
@@ -44,12 +65,14 @@ def generate_image(prompt: str, output_path: Path, size: str):
         print(f"Response: {data}")
         raise Exception("Unknown response format")
     
+    if target_size:
+        fit_to_video(output_path, target_size)
+    
     print(f"[OK] Saved: {output_path}")
     return output_path
 
 
 # Shorts용 엔딩 (세로)
-print("\n[1/2] Generating Shorts ending image (vertical)...")
 shorts_prompt = """
 Professional photograph of a YouTube engagement scene, vertical portrait format.
 - Clean white marble desk with soft natural lighting from window
@@ -60,11 +83,8 @@ Professional photograph of a YouTube engagement scene, vertical portrait format.
 - Photorealistic, high-end product photography style
 - NO text, NO words, NO logos
 """
-generate_image(shorts_prompt, output_dir / "ending_shorts.png", "1024x1536")
-
 
 # Video용 엔딩 (가로)
-print("\n[2/2] Generating Video ending image (horizontal)...")
 video_prompt = """
 Professional photograph of a YouTube engagement scene, horizontal landscape format.
 - Modern minimalist desk setup with soft studio lighting
@@ -76,10 +96,22 @@ Professional photograph of a YouTube engagement scene, horizontal landscape form
 - Photorealistic, cinematic quality
 - NO text, NO words, NO logos
 """
-generate_image(video_prompt, output_dir / "ending_video.png", "1536x1024")
+
+# (프롬프트, 경로, 생성 사이즈, 영상 해상도)
+jobs = [
+    (shorts_prompt, output_dir / "ending_shorts.png", "1024x1536", (1080, 1920)),
+    (video_prompt, output_dir / "ending_video.png", "1536x1024", (1920, 1080)),
+]
+
+# 두 이미지는 서로 독립적이므로 동시에 요청 (총 시간 = 가장 느린 요청)
+print(f"\n[1/1] Generating {len(jobs)} ending images (vertical + horizontal)...")
+with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+    futures = [ex.submit(generate_image, prompt, path, size, target) for prompt, path, size, target in jobs]
+    for future in futures:
+        future.result()
 
 print("\n" + "="*50)
 print("[OK] Ending images created with gpt-image-1.5!")
-print("  - assets/ending_shorts.png (1024x1536)")
-print("  - assets/ending_video.png (1536x1024)")
+print("  - assets/ending_shorts.png (1080x1920)")
+print("  - assets/ending_video.png (1920x1080)")
 print("="*50)
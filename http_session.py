@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+공용 HTTP 세션 (news_dual.py / create_ending_images.py)
+========================================================
+
+- BackoffSession: 429/5xx/타임아웃 시 지수 백오프 재시도 + 엔드포인트별 속도 제한
+- backoff_session(pool_size): keep-alive 커넥션 풀을 붙인 세션 생성
+"""
+
+import time
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TokenBucket:
+    """클라이언트 측 요청 속도 제한 (초당 rps개 보충, 최대 burst개까지 한꺼번에 허용) - 스레드 안전"""
+
+    def __init__(self, rps: float, burst: int):
+        self.rps = rps
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 쓸 수 있을 때까지 대기"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rps)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rps
+            time.sleep(wait)
+
+
+class BackoffSession(requests.Session):
+    """429/5xx/타임아웃 시 지수 백오프(full jitter)로 재시도 - Retry-After 헤더 우선
+
+    rate_limits의 (URL 접두사, TokenBucket)에 맞는 요청은 보내기 전에 토큰을 받음 (재시도 포함)
+    """
+    RETRY_STATUS = frozenset([429, 500, 502, 503, 504])
+    rate_limits = ()
+
+    def request(self, method, url, *args, max_attempts: int = 6, **kwargs):
+        bucket = next((b for prefix, b in self.rate_limits if url.startswith(prefix)), None)
+        for attempt in range(max_attempts):
+            retry_after = None
+            if bucket:
+                bucket.acquire()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.Timeout, requests.ConnectionError):
+                if attempt == max_attempts - 1:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUS or attempt == max_attempts - 1:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+
+            delay = random.uniform(0, min(60, 2 ** attempt))
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass  # HTTP-date 형식은 무시
+            time.sleep(delay)
+
+
+def backoff_session(pool_size: int = 32) -> BackoffSession:
+    """keep-alive 커넥션 풀을 붙인 BackoffSession
+
+    Authorization은 세션 기본 헤더에 두지 말고 호출마다 지정 - 이미지 CDN/NewsData로 OpenAI 키가 나가지 않도록
+    """
+    session = BackoffSession()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size,
+        max_retries=Retry(total=3, read=0, backoff_factor=0.5)  # 연결 실패만 (응답 재시도는 BackoffSession에서)
+    ))
+    return session
@@ -61,16 +61,27 @@ if sys.platform == 'win32' and sys.stdout and hasattr(sys.stdout, 'buffer'):
     except:
         pass  # subprocess에서 호출 시 실패할 수 있음
 
+import re
 import json
+import base64
 import time
+import random
+import shutil
+import hashlib
 import argparse
+import threading
 import subprocess
 import requests
+from functools import lru_cache
+from itertools import accumulate
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from PIL import Image, ImageDraw, ImageFont
+from http_session import TokenBucket, backoff_session
+from news_store import json_loads, json_dumps, read_used_log, append_used_log
 
 # Timezone for display (US Eastern - target audience)
 US_EASTERN = ZoneInfo("America/New_York")
@@ -85,10 +96,27 @@ load_dotenv()
 NEWSDATA_API_KEY = os.environ.get("NEWSDATA_API_KEY")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 OPENAI_API_BASE = "https://api.openai.com/v1"
+OPENAI_HEADERS = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}  # OpenAI 요청에만 전달
+
+# HTTP 세션 재사용 (keep-alive + 커넥션 풀, 429/5xx/타임아웃은 BackoffSession이 재시도)
+# Authorization은 OpenAI 호출에만 OPENAI_HEADERS로 지정 - 세션 기본 헤더에 두면 이미지 CDN/NewsData로도 키가 나감
+SESSION = backoff_session(pool_size=32)
+# 엔드포인트별 요청 속도 상한 - 동시 요청이 한꺼번에 몰려 429 → 백오프 대기로 늘어지지 않도록 미리 간격 조절
+SESSION.rate_limits = (
+    (f"{OPENAI_API_BASE}/chat/", TokenBucket(rps=10, burst=20)),
+    (f"{OPENAI_API_BASE}/images/", TokenBucket(rps=5, burst=5)),
+    (f"{OPENAI_API_BASE}/audio/", TokenBucket(rps=5, burst=10)),
+    ("https://newsdata.io/", TokenBucket(rps=1, burst=10)),  # 카테고리 동시 요청(8개)은 한 번에 통과
+)
 
 # Image sizes for GPT Image 1.5
 SHORTS_SIZE = "1024x1536"   # Vertical 2:3 (GPT Image 1.5 지원)
 VIDEO_SIZE = "1536x1024"    # Horizontal 3:2 (GPT Image 1.5 지원)
+# 생성 사이즈 → 영상 해상도 (워터마크 저장 시 미리 맞춰 두면 ffmpeg가 프레임마다 스케일하지 않음)
+OUTPUT_RESOLUTIONS = {SHORTS_SIZE: (1080, 1920), VIDEO_SIZE: (1920, 1080)}
+IMAGE_JPEG_QUALITY = 92     # 뉴스 이미지(영상 입력용 중간 파일) JPEG 품질
+# 이미지 생성 동시 요청 상한 - 뉴스별(4) x 이미지별(5) 동시 실행이 겹쳐도 한꺼번에 429가 나지 않도록
+IMAGE_REQUEST_SLOTS = threading.BoundedSemaphore(int(os.environ.get("IMAGE_CONCURRENCY", "6")))
 
 # Subtitle languages (5개로 제한 - YouTube API 할당량)
 LANGUAGES = ["en", "ko", "ja", "zh", "es"]
@@ -104,10 +132,54 @@ LANGUAGE_NAMES = {
 ASSETS_DIR = Path(__file__).parent / "assets"
 ENDING_SHORTS = ASSETS_DIR / "ending_shorts.png"
 ENDING_VIDEO = ASSETS_DIR / "ending_video.png"
+ENDING_SECONDS_SHORTS = 2.0
+ENDING_SECONDS_VIDEO = 3.0
 
 # Used news tracking (duplicate prevention) - Daily와 Weekly 분리
-USED_NEWS_FILE_DAILY = Path(__file__).parent / "used_news_daily.json"
-USED_NEWS_FILE_WEEKLY = Path(__file__).parent / "used_news_weekly.json"
+# 한 줄에 ID 하나씩 append-only 로그 (기존 .json은 첫 로드 시 자동 변환)
+USED_NEWS_FILE_DAILY = Path(__file__).parent / "used_news_daily.ndjson"
+USED_NEWS_FILE_WEEKLY = Path(__file__).parent / "used_news_weekly.ndjson"
+
+# API 결과 캐시 (같은 입력이면 재요청하지 않음)
+CACHE_DIR = Path(__file__).parent / "cache"
+NEWS_CACHE_TTL = 15 * 60  # NewsData 응답 캐시 (15분)
+TRANSLATION_CACHE_MAX = 5000  # 언어별 번역 캐시 최대 줄 수 (최근 사용 순으로 유지)
+CACHE_MAX_AGE = 7 * 24 * 3600  # 디스크 캐시 항목 보존 기간 (mtime 기준 7일) - 디렉터리를 처음 쓸 때 정리
+# 정리 제외: 번역은 언어별 파일 하나(줄 수 상한으로 자체 관리), 엔딩 클립은 몇 개뿐이고 매 실행 재사용
+CACHE_PRUNE_EXEMPT = frozenset(["translations", "ending"])
+ARTICLE_FIELDS = ("title", "description", "content", "source_name", "image_url", "link")  # 파이프라인에서 쓰는 기사 필드
+
+# 뉴스 앵커 스타일 TTS instructions
+TTS_INSTRUCTIONS = "Speak in a clear, professional news anchor tone. Confident and authoritative, with natural pacing and slight emphasis on key words."
+
+# ffmpeg 공통 옵션 - 배너/진행 로그를 끄면 파이프로 읽는 stderr가 에러만 남음 (stderr[:500]에 실제 원인이 담김)
+FFMPEG = ["ffmpeg", "-y", "-hide_banner", "-nostdin", "-loglevel", "error"]
+
+# 이미지 클립/엔딩 클립 공통 인코딩 설정 - 같아야 concat demuxer로 재인코딩 없이(-c copy) 이어붙일 수 있음
+VIDEO_FPS = 30
+# H.264 인코더별 옵션 (위에서부터 우선) - 실제로 동작하는 첫 번째 인코더 사용, VIDEO_ENCODER 환경변수로 고정 가능
+VIDEO_ENCODER_ARGS = {
+    "h264_nvenc": ["-preset", "p1", "-rc", "constqp", "-qp", "20", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-global_quality", "20", "-pix_fmt", "nv12"],
+    "h264_vaapi": ["-vaapi_device", os.environ.get("VAAPI_DEVICE", "/dev/dri/renderD128"), "-qp", "20"],
+    "h264_videotoolbox": ["-b:v", "6M", "-pix_fmt", "yuv420p"],
+    # 정지 이미지 클립 - stillimage 튜닝 + 긴 GOP (장면 전환 감지 없음)으로 반복 프레임은 거의 0비트 P프레임
+    "libx264": ["-tune", "stillimage", "-x264-params", "keyint=300:scenecut=0", "-pix_fmt", "yuv420p"],
+}
+# 스케일 필터 뒤에 붙일 GPU 업로드 (VAAPI는 프레임을 GPU 메모리로 올려야 인코딩 가능)
+VIDEO_HW_UPLOAD = {"h264_vaapi": ",format=nv12,hwupload"}
+AUDIO_CODEC_ARGS = ["-c:a", "aac", "-b:a", "192k", "-ar", "48000", "-ac", "1"]
+# 동시 ffmpeg 인코딩 수 - Shorts/Video 렌더링이 겹쳐도 합쳐서 코어 수의 절반 정도만 사용
+ENCODE_CONCURRENCY = max(2, (os.cpu_count() or 4) // 2)
+ENCODE_SLOTS = threading.BoundedSemaphore(ENCODE_CONCURRENCY)
+# 입력마다 큐를 넉넉히 (영상/오디오 입력을 동시에 읽을 때 "Thread message queue blocking" 대기 방지)
+INPUT_QUEUE_ARGS = ["-thread_queue_size", "1024"]
+# concat 목록을 stdin으로 받는 입력 (run_ffmpeg(..., stdin_data=목록)과 함께 사용) - 목록 파일 쓰기/삭제 없음
+CONCAT_STDIN = ["-protocol_whitelist", "file,pipe", "-f", "concat", "-safe", "0", "-i", "pipe:0"]
+
+# TTS/자막 공통 정규식 (모듈 로드 시 한 번만 컴파일)
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')  # 문장 단위 분할 (마침표, 느낌표, 물음표 뒤)
+NUMBERED_LINE_RE = re.compile(r'^\d+\.\s*(.+)$')  # 번역 결과 "1. 텍스트"
 
 
 def generate_opening_image(output_path: Path, orientation: str = "vertical", top_headline: str = "", total_count: int = 6) -> Path:
@@ -147,10 +219,17 @@ STYLE:
 Make it look exciting and clickable! The viewer should want to know about this story."""
 
     print(f"    Opening: TOP headline = {top_headline[:30]}...")
+    
+    # 같은 날 재실행(실패 후 재시도 등)이면 같은 프롬프트 → 캐시된 이미지 재사용 (프롬프트에 날짜/헤드라인 포함)
+    cache_path = cached_file("opening", cache_key("gpt-image-1.5", "high", size, prompt), ".png")
+    if cache_path.exists():
+        shutil.copyfile(cache_path, output_path)
+        print(f"    [CACHE] Opening image")
+        return output_path
 
-    response = requests.post(
+    response = SESSION.post(
         f"{OPENAI_API_BASE}/images/generations",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+        headers=OPENAI_HEADERS,
         json={"model": "gpt-image-1.5", "prompt": prompt, "n": 1, "size": size, "quality": "high"},
         timeout=120
     )
@@ -158,20 +237,13 @@ Make it look exciting and clickable! The viewer should want to know about this s
     if response.status_code != 200:
         raise Exception(f"Opening image error: {response.text}")
     
-    data = response.json()["data"][0]
+    data = json_loads(response.content)["data"][0]
     
-    if "b64_json" in data:
-        import base64
-        img_data = base64.b64decode(data["b64_json"])
-        with open(output_path, 'wb') as f:
-            f.write(img_data)
-    elif "url" in data:
-        img_response = requests.get(data["url"], timeout=60)
-        with open(output_path, 'wb') as f:
-            f.write(img_response.content)
+    save_image_data(data, output_path)
     
     # 워터마크 추가 (오프닝은 하단)
-    add_watermark(output_path, position="bottom")
+    add_watermark(output_path, position="bottom", fit_size=OUTPUT_RESOLUTIONS.get(size))
+    store_cached_file(output_path, cache_path)
     
     return output_path
 
@@ -182,12 +254,20 @@ def generate_breaking_opening_image(output_path: Path, news: dict, orientation:
     date_text = today.strftime("%b %d, %Y")  # Jan 05, 2026
     
     news_title = news.get('title', '')
+    size = SHORTS_SIZE if orientation == "vertical" else VIDEO_SIZE
+    
+    # 같은 속보로 재실행하면 헤드라인 요약 + 이미지 생성 모두 생략
+    cache_path = cached_file("opening", cache_key("breaking", "gpt-image-1.5", "high", size, date_text, news_title), ".png")
+    if cache_path.exists():
+        shutil.copyfile(cache_path, output_path)
+        print(f"    [CACHE] Breaking opening image")
+        return output_path
     
     # 헤드라인 간결하게 (GPT로 요약)
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{OPENAI_API_BASE}/chat/completions",
-            headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+            headers=OPENAI_HEADERS,
             json={
                 "model": "gpt-4o-mini",
                 "messages": [{"role": "user", "content": f"Summarize this headline in 3-5 impactful words for a thumbnail. Just the summary, nothing else:\n\n{news_title}"}],
@@ -196,18 +276,13 @@ def generate_breaking_opening_image(output_path: Path, news: dict, orientation:
             timeout=30
         )
         if response.status_code == 200:
-            short_headline = response.json()["choices"][0]["message"]["content"].strip().strip('"')
+            short_headline = json_loads(response.content)["choices"][0]["message"]["content"].strip().strip('"')
         else:
             short_headline = news_title[:30]
     except:
         short_headline = news_title[:30]
     
-    if orientation == "vertical":
-        size = SHORTS_SIZE
-        format_desc = "vertical 9:16"
-    else:
-        size = VIDEO_SIZE
-        format_desc = "horizontal 16:9"
+    format_desc = "vertical 9:16" if orientation == "vertical" else "horizontal 16:9"
     
     print(f"    Breaking: {short_headline}")
     
@@ -228,9 +303,9 @@ STYLE:
 
 Make it look URGENT! The viewer must click to know what happened."""
 
-    response = requests.post(
+    response = SESSION.post(
         f"{OPENAI_API_BASE}/images/generations",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+        headers=OPENAI_HEADERS,
         json={"model": "gpt-image-1.5", "prompt": prompt, "n": 1, "size": size, "quality": "high"},
         timeout=120
     )
@@ -238,109 +313,13 @@ Make it look URGENT! The viewer must click to know what happened."""
     if response.status_code != 200:
         raise Exception(f"Breaking opening image error: {response.text}")
     
-    data = response.json()["data"][0]
+    data = json_loads(response.content)["data"][0]
     
-    if "b64_json" in data:
-        import base64
-        img_data = base64.b64decode(data["b64_json"])
-        with open(output_path, 'wb') as f:
-            f.write(img_data)
-    elif "url" in data:
-        img_response = requests.get(data["url"], timeout=60)
-        with open(output_path, 'wb') as f:
-            f.write(img_response.content)
+    save_image_data(data, output_path)
     
     # 워터마크 추가 (브레이킹 오프닝도 하단)
-    add_watermark(output_path, position="bottom")
-    
-    return output_path
-    news_category = news.get('category', '')
-    
-    # Ask GPT to determine breaking news visual theme
-    theme_prompt = f"""This is BREAKING NEWS. Generate an urgent, attention-grabbing image theme.
-
-News headline: "{news_title}"
-Category: {news_category}
-
-Create a dramatic visual theme that matches this breaking news:
-- For disasters/accidents: emergency colors, dramatic atmosphere
-- For political news: official, serious government vibes  
-- For war/conflict: somber, urgent military tones
-- For economic crisis: financial charts, market tension
-- For celebrity death: respectful, memorial atmosphere
-- For sports: victory/defeat dramatic moment
-
-Reply with ONLY a short urgent image theme description in English (one line).
-Must include: "BREAKING NEWS" urgent feel, dramatic lighting, attention-grabbing.
-Example: "Breaking news urgent alert, red and black dramatic colors, emergency broadcast style"
-Example: "Breaking financial crisis, stock market crash visualization, urgent red tones" """
-
-    try:
-        response = requests.post(
-            f"{OPENAI_API_BASE}/chat/completions",
-            headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-            json={
-                "model": "gpt-4o-mini",
-                "messages": [{"role": "user", "content": theme_prompt}],
-                "temperature": 0.5
-            },
-            timeout=30
-        )
-        if response.status_code == 200:
-            theme_desc = response.json()["choices"][0]["message"]["content"].strip().strip('"')
-        else:
-            theme_desc = "Breaking news urgent alert, red and black dramatic colors, emergency broadcast style"
-    except:
-        theme_desc = "Breaking news urgent alert, red and black dramatic colors, emergency broadcast style"
-    
-    print(f"    Breaking theme: {theme_desc[:50]}...")
-    
-    if orientation == "vertical":
-        size = SHORTS_SIZE
-        format_desc = "vertical 9:16"
-    else:
-        size = VIDEO_SIZE
-        format_desc = "horizontal 16:9"
-    
-    prompt = f"""Create an URGENT breaking news opening image.
-
-MUST INCLUDE TEXT (in this exact order, top to bottom):
-1. "BREAKING NEWS" in bold, urgent red/white typography, positioned around 10% from top (NOT at the very top edge)
-2. The date "{date_text}" - freely positioned where it fits best in the composition
-
-NO other text, NO headlines, NO logos - ONLY these two texts.
-
-Theme: {theme_desc}
-
-Style:
-- URGENT breaking news broadcast feel
-- Dramatic, attention-grabbing
-- Professional news aesthetic
-- {format_desc} format
-
-The ONLY text allowed is "BREAKING NEWS" and "{date_text}" - nothing else."""
-
-    response = requests.post(
-        f"{OPENAI_API_BASE}/images/generations",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-        json={"model": "gpt-image-1.5", "prompt": prompt, "n": 1, "size": size, "quality": "high"},
-        timeout=120
-    )
-    
-    if response.status_code != 200:
-        raise Exception(f"Breaking opening image error: {response.text}")
-    
-    data = response.json()["data"][0]
-    
-    if "b64_json" in data:
-        import base64
-        img_data = base64.b64decode(data["b64_json"])
-        with open(output_path, 'wb') as f:
-            f.write(img_data)
-    elif "url" in data:
-        img_response = requests.get(data["url"], timeout=60)
-        with open(output_path, 'wb') as f:
-            f.write(img_response.content)
+    add_watermark(output_path, position="bottom", fit_size=OUTPUT_RESOLUTIONS.get(size))
+    store_cached_file(output_path, cache_path)
     
     return output_path
 
@@ -366,34 +345,243 @@ TRUSTED_SOURCES = [
     "afp", "agence france-presse",
 ]
 
+# 언론사 매칭용 사전 컴파일 (정확히 일치 → frozenset, 부분 일치 → 단일 정규식)
+TRUSTED_EXACT = frozenset(TRUSTED_SOURCES)
+TRUSTED_RE = re.compile("|".join(map(re.escape, sorted(TRUSTED_SOURCES, key=len, reverse=True))))
+
+
+@lru_cache(maxsize=512)
+def is_trusted_source(source: str) -> bool:
+    """신뢰 언론사 여부 (부분 일치) - 언론사 이름은 반복이 많아 결과 캐시"""
+    source_lower = source.lower()
+    return source_lower in TRUSTED_EXACT or TRUSTED_RE.search(source_lower) is not None
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
 
+def run_concurrent(func, items: list, max_workers: int = 8) -> list:
+    """독립적인 API 호출들을 동시에 실행 (결과는 입력 순서 유지)"""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+        return list(ex.map(func, items))
+
+
+# 이미지 후처리(워터마크) 전용 풀 - 다음 이미지 API 호출과 겹쳐서 실행
+POSTPROCESS_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+_pending_postprocess = []
+
+
+def submit_postprocess(func, *args, **kwargs):
+    """로컬 CPU 후처리를 백그라운드로 넘김 (wait_postprocess()로 완료 대기)"""
+    future = POSTPROCESS_POOL.submit(func, *args, **kwargs)
+    _pending_postprocess.append(future)
+    return future
+
+
+def wait_postprocess():
+    """대기 중인 이미지 후처리가 모두 끝날 때까지 대기"""
+    while _pending_postprocess:
+        _pending_postprocess.pop().result()
+
+
+def _unlink_all(paths):
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def discard_files(paths):
+    """임시 파일 삭제를 백그라운드로 넘김 - 호출자는 삭제 시스템 콜을 기다리지 않고 바로 다음 단계 진행"""
+    return submit_postprocess(_unlink_all, list(paths))
+
+
+def report_failure(future):
+    """add_done_callback용 - 백그라운드 작업 실패를 결과 수집 시점까지 기다리지 않고 바로 출력"""
+    if not future.cancelled() and future.exception() is not None:
+        print(f"  [ERROR] Background task failed: {future.exception()}")
+
+
+def cache_key(*parts) -> str:
+    """캐시 키 (입력값 sha256)"""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+_prepared_cache_dirs = set()
+_cache_dir_lock = threading.Lock()
+
+
+def prune_cache_dir(cache_dir: Path, max_age: float = CACHE_MAX_AGE):
+    """mtime이 max_age보다 오래된 캐시 파일 삭제 (캐시 디렉터리가 끝없이 커지지 않도록)"""
+    cutoff = time.time() - max_age
+    removed = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError:
+                pass  # 다른 프로세스가 쓰는 중/이미 삭제됨
+    return removed
+
+
+def cached_file(kind: str, key: str, suffix: str) -> Path:
+    """cache/{kind}/{key}{suffix} 경로 - 실행 중 처음 쓰는 디렉터리는 만들고 오래된 항목 정리"""
+    cache_dir = CACHE_DIR / kind
+    if kind not in _prepared_cache_dirs:
+        # 정리가 끝나기 전에 다른 스레드가 곧 지워질 파일을 캐시 히트로 쓰지 않도록 잠금
+        with _cache_dir_lock:
+            if kind not in _prepared_cache_dirs:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                if kind not in CACHE_PRUNE_EXEMPT:
+                    prune_cache_dir(cache_dir)
+                _prepared_cache_dirs.add(kind)
+    return cache_dir / f"{key}{suffix}"
+
+
+def store_cached_file(src: Path, cache_path: Path):
+    """생성된 파일을 캐시에 저장 (임시 파일 + os.replace로 원자적 저장)"""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, cache_path)
+
+
+def stream_to_file(response, output_path: Path) -> Path:
+    """stream=True 응답을 메모리에 전부 올리지 않고 64KB 단위로 파일에 바로 기록"""
+    response.raw.decode_content = True
+    with open(output_path, 'wb') as f:
+        shutil.copyfileobj(response.raw, f, length=65536)
+    return output_path
+
+
+def download_file(url: str, output_path: Path, timeout: int = 60) -> Path:
+    """URL 다운로드 → 파일 (스트리밍)"""
+    with SESSION.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        return stream_to_file(response, output_path)
+
+
+def save_image_data(data: dict, output_path: Path) -> Path:
+    """이미지 API 결과 → 파일 (b64_json은 64KB 단위로 디코딩해 기록, url은 스트리밍 다운로드)
+    
+    디코딩된 이미지 전체를 bytes로 한 번 더 들고 있지 않도록 청크 단위로 씀 (64KB는 4의 배수라 청크별 디코딩 가능)
+    """
+    if "b64_json" in data:
+        b64 = data["b64_json"]
+        with open(output_path, 'wb') as f:
+            for start in range(0, len(b64), 65536):
+                f.write(base64.b64decode(b64[start:start + 65536]))
+    elif "url" in data:
+        download_file(data["url"], output_path)
+    else:
+        raise Exception(f"Unknown response format: {data.keys()}")
+    return output_path
+
+
+def tts_cache_path(text: str, voice: str) -> Path:
+    """TTS 캐시 경로 (모델 + 음성 + instructions + 텍스트 해시)"""
+    return cached_file("tts", cache_key("gpt-4o-mini-tts", voice, TTS_INSTRUCTIONS, text), ".mp3")
+
+
+def request_tts(text: str, output_path: Path, voice: str, timeout: int = 120, error_label: str = "TTS Error") -> Path:
+    """OpenAI TTS 호출 - 같은 (모델, 음성, 텍스트)는 캐시에서 재사용"""
+    cache_path = tts_cache_path(text, voice)
+    if cache_path.exists():
+        shutil.copyfile(cache_path, output_path)
+        return output_path
+    
+    with SESSION.post(
+        f"{OPENAI_API_BASE}/audio/speech",
+        headers=OPENAI_HEADERS,
+        json={
+            "model": "gpt-4o-mini-tts",
+            "input": text,
+            "voice": voice,
+            "instructions": TTS_INSTRUCTIONS,
+            "response_format": "mp3"
+        },
+        timeout=timeout,
+        stream=True
+    ) as response:
+        if response.status_code != 200:
+            raise Exception(f"{error_label}: {response.text}")
+        stream_to_file(response, output_path)
+    store_cached_file(output_path, cache_path)
+    return output_path
+
+
+def get_newsdata_latest(category: str):
+    """NewsData.io 카테고리 최신 뉴스 - (status_code, data) 반환, 15분 단위로 캐시"""
+    bucket = int(time.time() // NEWS_CACHE_TTL)
+    cache_path = cached_file("news", cache_key(category, bucket), ".json")
+    if cache_path.exists():
+        return 200, json_loads(cache_path.read_bytes())
+    
+    response = SESSION.get(
+        "https://newsdata.io/api/1/latest",
+        params={
+            "apikey": NEWSDATA_API_KEY,
+            "language": "en",
+            "category": category,
+            "prioritydomain": "top",
+            "size": 10  # 무료 플랜 최대
+        },
+        timeout=30
+    )
+    
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    data = json_loads(response.content)
+    if data.get("status") == "success":
+        # 사용하는 필드만 남겨서 반환/캐시 (기사당 수십 개 필드 중 6개만 사용)
+        data = {
+            "status": "success",
+            "results": [{field: article[field] for field in ARTICLE_FIELDS if field in article} for article in data.get("results", [])]
+        }
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_bytes(json_dumps(data))
+        os.replace(tmp_path, cache_path)
+    return 200, data
+
+
+def _get_newsdata_safe(category: str):
+    try:
+        return get_newsdata_latest(category)
+    except Exception as e:
+        return e
+
+
+def prefetch_categories(categories: list) -> dict:
+    """카테고리별 NewsData 요청을 동시에 실행 - {category: (status_code, data) 또는 Exception}"""
+    return dict(zip(categories, run_concurrent(_get_newsdata_safe, categories)))
+
+
 def load_used_news(news_type: str = "daily") -> set:
     """이미 사용한 뉴스 ID/제목 로드"""
     file_path = USED_NEWS_FILE_DAILY if news_type == "daily" else USED_NEWS_FILE_WEEKLY
-    if file_path.exists():
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return set(data.get("used", []))
-    return set()
+    return set(read_used_log(file_path))
 
 
-def save_used_news(used: set, news_type: str = "daily", max_keep: int = 200):
-    """사용한 뉴스 저장 (최근 200개만 유지)"""
+def save_used_news(used, news_type: str = "daily", max_keep: int = 200):
+    """사용한 뉴스 저장 - 새 ID만 넘겨준 순서대로 append (로그가 2배 넘게 커지면 최근 200개로 압축)"""
     file_path = USED_NEWS_FILE_DAILY if news_type == "daily" else USED_NEWS_FILE_WEEKLY
-    used_list = list(used)[-max_keep:]  # 최근 200개만
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump({"used": used_list}, f)
+    append_used_log(file_path, used, max_keep)
+
+@lru_cache(maxsize=4096)
+def _title_id(title: str) -> str:
+    """제목 → ID (같은 기사가 필터/선택/저장 단계마다 다시 해시되지 않도록 캐시)"""
+    return hashlib.md5(title.encode(), usedforsecurity=False).hexdigest()[:16]
 
 
 def get_news_id(news: dict) -> str:
-    """뉴스 고유 ID 생성 (제목 기반 해시)"""
-    import hashlib
-    title = news.get("title", "")
-    return hashlib.md5(title.encode()).hexdigest()[:16]
+    """뉴스 고유 ID 생성 (제목 기반 해시)
+    
+    보안 용도가 아닌 중복 체크 키 - 기존 used news 기록과 호환되도록 MD5[:16] 유지
+    """
+    return _title_id(news.get("title", ""))
 
 
 def fetch_global_news(count: int = 5) -> list:
@@ -430,6 +618,37 @@ CATEGORY_NAMES = {
 }
 
 
+def filter_articles(data: dict, category: str, used_news: set) -> list:
+    """NewsData 응답 → 사용 가능한 뉴스 목록 (이미 사용한 뉴스, 짧은 제목/설명 없는 기사 제외)"""
+    items = []
+    category_name = CATEGORY_NAMES.get(category, category.title())
+    for article in data.get("results", []):
+        # 제목/설명 품질 체크 - 싼 검사를 먼저 해서 버릴 기사는 dict 생성/해시 없이 건너뜀
+        title = article.get("title", "") or ""
+        description = article.get("description", "") or article.get("content", "")
+        if len(title) < 20 or not description:
+            continue
+        
+        news = {
+            "title": title,
+            "description": description,
+            "source": article.get("source_name", ""),
+            "category": category_name,
+            "image_url": article.get("image_url", ""),
+            "link": article.get("link", ""),
+        }
+        
+        # 중복 체크
+        if get_news_id(news) in used_news:
+            continue
+        
+        # 신뢰도 체크 (마크 표시용)
+        news['is_trusted'] = is_trusted_source(news['source'])
+        
+        items.append(news)
+    return items
+
+
 def fetch_news_by_categories(categories: list = None, backup_per_category: int = 3) -> list:
     """카테고리별 Top 뉴스 가져오기 (백업 포함)"""
     if categories is None:
@@ -443,53 +662,26 @@ def fetch_news_by_categories(categories: list = None, backup_per_category: int =
     used_news = load_used_news("weekly")
     news_items = []
     
+    # 카테고리 요청은 서로 독립적이므로 한꺼번에 동시 요청 (총 시간 ≈ 가장 느린 응답)
+    fetched = prefetch_categories(categories)
+    
     for category in categories:
         try:
-            response = requests.get(
-                "https://newsdata.io/api/1/latest",
-                params={
-                    "apikey": NEWSDATA_API_KEY,
-                    "language": "en",
-                    "category": category,
-                    "prioritydomain": "top",
-                    "size": 10  # 무료 플랜 최대
-                },
-                timeout=30
-            )
+            result = fetched[category]
+            if isinstance(result, Exception):
+                raise result
+            status_code, data = result
             
-            if response.status_code != 200:
+            if status_code != 200:
                 print(f"  [FAIL] {category}: API error")
                 continue
             
-            data = response.json()
             if data.get("status") != "success":
                 print(f"  [FAIL] {category}: No results")
                 continue
             
             # 중복 아닌 뉴스들 저장 (나중에 정책 위반 시 사용)
-            category_news = []
-            for article in data.get("results", []):
-                news = {
-                    "title": article.get("title", ""),
-                    "description": article.get("description", "") or article.get("content", ""),
-                    "source": article.get("source_name", ""),
-                    "category": CATEGORY_NAMES.get(category, category),
-                    "link": article.get("link", ""),
-                }
-                
-                news_id = get_news_id(news)
-                if news_id in used_news:
-                    continue
-                
-                # 제목/설명 품질 체크
-                if len(news['title']) < 20 or not news['description']:
-                    continue
-                    
-                # 신뢰도 체크 (마크 표시용)
-                source_lower = news['source'].lower()
-                news['is_trusted'] = any(trusted in source_lower for trusted in TRUSTED_SOURCES)
-                
-                category_news.append(news)
+            category_news = filter_articles(data, category, used_news)
             
             if category_news:
                 news_items.extend(category_news)  # 모든 백업 포함
@@ -505,15 +697,26 @@ def fetch_news_by_categories(categories: list = None, backup_per_category: int =
 
 
 def generate_image_prompts(news: dict, count: int, orientation: str) -> list:
-    """Generate image prompts with text overlay (new style)"""
+    """Generate image prompts with text overlay (new style)
+    
+    같은 뉴스(제목+설명)/개수/방향이면 cache/prompts의 이전 결과 재사용 → 재실행 시 프롬프트가 같아
+    이미지 캐시도 그대로 적중
+    """
     orient_desc = "vertical portrait 9:16" if orientation == "vertical" else "horizontal landscape 16:9"
     
     # 짧은 헤드라인 추출
     title = news.get('title', '')[:50]
     
-    response = requests.post(
+    cache_path = cached_file("prompts", cache_key("gpt-5-mini", count, orientation, news['title'],
+                                                  news.get('description', '')[:200]), ".json")
+    try:
+        return json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    
+    response = SESSION.post(
         f"{OPENAI_API_BASE}/chat/completions",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+        headers=OPENAI_HEADERS,
         json={
             "model": "gpt-5-mini",
             "messages": [{
@@ -532,15 +735,22 @@ Output one prompt per line, no numbering. Under 80 words each."""
                 "content": f"News: {news['title']}\n{news.get('description', '')[:200]}"
             }],
             "max_completion_tokens": 500,
-            "reasoning_effort": "minimal"
+            "reasoning_effort": "minimal",
+            "prompt_cache_key": "news-image-prompts"
         },
         timeout=30
     )
     
     if response.status_code == 200:
-        content = response.json()["choices"][0]["message"]["content"].strip()
-        prompts = [p.strip() for p in content.split('\n') if p.strip()]
-        return prompts[:count] if prompts else [f"Cinematic photo, back view or silhouette only, {orient_desc}"] * count
+        content = json_loads(response.content)["choices"][0]["message"]["content"].strip()
+        prompts = [p.strip() for p in content.split('\n') if p.strip()][:count]
+        if prompts:
+            # 실제 API 결과만 저장 (실패 시 기본 프롬프트는 캐시하지 않음)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            tmp_path.write_bytes(json_dumps(prompts))
+            os.replace(tmp_path, cache_path)
+            return prompts
+        return [f"Cinematic photo, back view or silhouette only, {orient_desc}"] * count
     return [f"Cinematic photo, back view or silhouette only, {orient_desc}"] * count
 
 
@@ -570,13 +780,46 @@ def generate_image_prompts_fallback(news: dict, count: int, orientation: str) ->
 # WATERMARK FUNCTION
 # =============================================================================
 
-def add_watermark(image_path: Path, text: str = "AI NEWS DAILY | AI GENERATED", position: str = "center") -> Path:
+FONT_BOLD = "C:/Windows/Fonts/arialbd.ttf"
+FONT_REGULAR = "C:/Windows/Fonts/arial.ttf"
+
+
+@lru_cache(maxsize=32)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """TrueType 폰트 로드 - (경로, 크기)별로 한 번만 파일을 읽고 파싱 (워터마크/썸네일에서 반복 사용)"""
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=64)
+def _text_mask(text: str, font) -> tuple:
+    """문구 래스터화 결과(L 마스크)를 (문구, 폰트)별로 캐시 - "TODAY'S"/"NEWS"/날짜 등은 매번 같음
+
+    (마스크, 원점 x 오프셋, 원점 y 오프셋) 반환 - 음수 bbox(왼쪽 베어링 등)도 잘리지 않도록 오프셋 보정
+    """
+    left, top, right, bottom = font.getbbox(text)
+    ox, oy = max(0, -left), max(0, -top)
+    mask = Image.new("L", (max(1, ox + right), max(1, oy + bottom)), 0)
+    ImageDraw.Draw(mask).text((ox, oy), text, font=font, fill=255)
+    return mask, ox, oy
+
+
+def _draw_shadowed_text(img, xy: tuple, text: str, font, fill: str, shadow: int) -> None:
+    """그림자(검정, shadow px 오프셋) + 본문 색 텍스트 - 래스터화는 한 번, 마스크 합성만 두 번"""
+    mask, ox, oy = _text_mask(text, font)
+    x, y = xy[0] - ox, xy[1] - oy
+    img.paste("black", (x + shadow, y + shadow), mask)
+    img.paste(fill, (x, y), mask)
+
+
+def add_watermark(image_path: Path, text: str = "AI NEWS DAILY | AI GENERATED", position: str = "center",
+                  fit_size: tuple = None) -> Path:
     """이미지에 고정 크기 워터마크 추가
     
     Args:
         image_path: 이미지 파일 경로
         text: 워터마크 텍스트
         position: "center" (화면 가운데) 또는 "bottom" (하단 가운데)
+        fit_size: 저장 전에 맞출 영상 해상도 (Lanczos 한 번) - 렌더링 때 스케일 필터 생략
     """
     try:
         img = Image.open(image_path).convert("RGBA")
@@ -588,10 +831,10 @@ def add_watermark(image_path: Path, text: str = "AI NEWS DAILY | AI GENERATED",
         # 폰트 설정 (고정 크기)
         font_size = 28
         try:
-            font = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", font_size)
+            font = _load_font(FONT_BOLD, font_size)
         except:
             try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
+                font = _load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
             except:
                 font = ImageFont.load_default()
         
@@ -620,9 +863,11 @@ def add_watermark(image_path: Path, text: str = "AI NEWS DAILY | AI GENERATED",
         # 합성
         img = Image.alpha_composite(img, overlay)
         
-        # RGB로 변환 후 저장
+        # RGB로 변환 후 저장 (JPEG 중간 파일은 같은 품질로, PNG는 quality 무시)
         img = img.convert("RGB")
-        img.save(image_path)
+        if fit_size and img.size != fit_size:
+            img = img.resize(fit_size, Image.LANCZOS)
+        img.save(image_path, quality=IMAGE_JPEG_QUALITY)
         
         return image_path
     except Exception as e:
@@ -634,44 +879,47 @@ def generate_image(prompt: str, output_path: Path, size: str, retry_count: int =
     """Generate image with GPT Image 1.5 + 워터마크 추가"""
     # size 변환: DALL-E 형식 -> gpt-image-1.5 형식
     # gpt-image-1.5는 auto, 1024x1024, 1536x1024, 1024x1536 지원
-    if size == "1024x1792":  # Shorts (세로)
+    # SHORTS_SIZE/VIDEO_SIZE는 그대로 요청 - 정사각형으로 받으면 9:16/16:9로 늘려져 찌그러지고 OUTPUT_RESOLUTIONS 리사이즈도 안 탐
+    if size in (SHORTS_SIZE, VIDEO_SIZE):
+        img_size = size
+    elif size == "1024x1792":  # Shorts (세로)
         img_size = "1024x1536"
     elif size == "1792x1024":  # Video (가로)
         img_size = "1536x1024"
     else:
         img_size = "1024x1024"
     
-    response = requests.post(
-        f"{OPENAI_API_BASE}/images/generations",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-        json={"model": "gpt-image-1.5", "prompt": prompt, "n": 1, "size": img_size, "quality": "medium"},
-        timeout=120
-    )
+    # 같은 프롬프트/사이즈는 캐시된 원본 재사용 (워터마크는 매번 적용)
+    cache_path = cached_file("images", cache_key("gpt-image-1.5", img_size, "medium", "jpeg", prompt), ".jpg")
+    if cache_path.exists():
+        shutil.copyfile(cache_path, output_path)
+        submit_postprocess(add_watermark, output_path, position=watermark_position, fit_size=OUTPUT_RESOLUTIONS.get(img_size))
+        return output_path
+    
+    with IMAGE_REQUEST_SLOTS:
+        response = SESSION.post(
+            f"{OPENAI_API_BASE}/images/generations",
+            headers=OPENAI_HEADERS,
+            # 영상 입력용 중간 파일이라 무손실 PNG 대신 JPEG (파일 크기 ~1/10 - 응답/디스크/ffmpeg 디코딩 모두 가벼워짐)
+            json={"model": "gpt-image-1.5", "prompt": prompt, "n": 1, "size": img_size, "quality": "medium",
+                  "output_format": "jpeg", "output_compression": IMAGE_JPEG_QUALITY},
+            timeout=120
+        )
     
     if response.status_code != 200:
-        error_data = response.json().get("error", {})
+        error_data = json_loads(response.content).get("error", {})
         error_code = error_data.get("code", "")
         if error_code == "content_policy_violation":
             raise ContentPolicyError(f"Content policy violation: {prompt[:50]}...")
         raise Exception(f"Image Error: {response.text}")
     
-    data = response.json()["data"][0]
+    data = json_loads(response.content)["data"][0]
     
-    # url 또는 b64_json 형식 처리
-    if "url" in data:
-        img_response = requests.get(data["url"], timeout=60)
-        with open(output_path, 'wb') as f:
-            f.write(img_response.content)
-    elif "b64_json" in data:
-        import base64
-        img_data = base64.b64decode(data["b64_json"])
-        with open(output_path, 'wb') as f:
-            f.write(img_data)
-    else:
-        raise Exception(f"Unknown response format: {data.keys()}")
+    save_image_data(data, output_path)
+    store_cached_file(output_path, cache_path)
     
-    # 워터마크 추가
-    add_watermark(output_path, position=watermark_position)
+    # 워터마크 추가 (백그라운드 - 호출자는 바로 다음 이미지 요청 진행)
+    submit_postprocess(add_watermark, output_path, position=watermark_position, fit_size=OUTPUT_RESOLUTIONS.get(img_size))
     
     return output_path
 
@@ -681,6 +929,62 @@ class ContentPolicyError(Exception):
     pass
 
 
+def generate_news_images(news: dict, prompts: list, img_paths: list, size: str, orientation: str) -> list:
+    """뉴스 한 건의 이미지들을 동시에 생성 (결과는 프롬프트 순서 유지)
+    
+    정책 위반 시 이미지별로 1차 리얼리스틱 → 2차 얼굴 없이 → 3차 추상 이미지 순으로 재시도,
+    3차도 실패하면 ContentPolicyError
+    """
+    total = len(prompts)
+    
+    def render(item):
+        j, (prompt, img_path) = item
+        try:
+            # 1차: 일반 리얼리스틱
+            generate_image(prompt, img_path, size)
+            print(f"    [OK] Image {j}/{total}")
+        except ContentPolicyError:
+            # 2차: 얼굴 없이 (뒷모습/실루엣)
+            print(f"    [RETRY] Image {j} policy error - trying without face...")
+            try:
+                safe_prompts = generate_image_prompts_safe(news, total, orientation)
+                safe_prompt = safe_prompts[j-1] if j <= len(safe_prompts) else safe_prompts[0]
+                generate_image(safe_prompt, img_path, size)
+                print(f"    [OK] Image {j}/{total} (no face)")
+            except ContentPolicyError:
+                # 3차: 추상적 이미지
+                print(f"    [RETRY] Still failed - using abstract...")
+                fallback_prompts = generate_image_prompts_fallback(news, total, orientation)
+                fallback_prompt = fallback_prompts[j-1] if j <= len(fallback_prompts) else fallback_prompts[0]
+                generate_image(fallback_prompt, img_path, size)
+                print(f"    [OK] Image {j}/{total} (abstract)")
+        return img_path
+    
+    # 이미지 API 대기 시간이 대부분이므로 뉴스 내 이미지들을 동시에 요청
+    return run_concurrent(render, list(enumerate(zip(prompts, img_paths), 1)), max_workers=5)
+
+
+def render_news_images(news: dict, slot: int, count: int, orientation: str, output_dir: Path, ts: str, tag: str) -> list:
+    """뉴스 한 건: 이미지 프롬프트 생성 → 이미지 생성, 이미지 경로 목록 반환"""
+    size = SHORTS_SIZE if orientation == "vertical" else VIDEO_SIZE
+    prompts = generate_image_prompts(news, count=count, orientation=orientation)
+    img_paths = [output_dir / f"{ts}_{tag}_{slot}_{j}.jpg" for j in range(1, len(prompts) + 1)]
+    return generate_news_images(news, prompts, img_paths, size, orientation)
+
+
+def render_news_batch(batch: list, count: int, orientation: str, output_dir: Path, ts: str, tag: str) -> list:
+    """여러 뉴스의 이미지를 동시에 생성 - [(slot, news), ...] → [(news, 경로 목록 또는 Exception), ...] (순서 유지)"""
+    def render(item):
+        slot, news = item
+        try:
+            return render_news_images(news, slot, count, orientation, output_dir, ts, tag)
+        except Exception as e:
+            return e
+    
+    # 뉴스별로도 이미지 여러 장을 동시에 요청하므로 뉴스 단위 동시 실행은 4개까지
+    return list(zip((news for _, news in batch), run_concurrent(render, batch, max_workers=4)))
+
+
 def fetch_global_news_with_backup(count: int, backup_count: int = 5) -> list:
     """Fetch news from multiple categories to ensure diversity (Daily Shorts용)"""
     print(f"\n[1/8] Fetching news (target: {count}, backup: {backup_count})...")
@@ -690,72 +994,40 @@ def fetch_global_news_with_backup(count: int, backup_count: int = 5) -> list:
     
     used_news = load_used_news("daily")
     news_items = []
-    
-    # 8개 글로벌 카테고리 (지역성 카테고리 제외)
-    all_categories = [
-        "world", "business", "technology", "science", 
-        "health", "sports", "entertainment", "environment"
-    ]
+    seen_categories = set()
     
     # 랜덤 순서로 섞기 (다양성)
-    import random
+    all_categories = list(ALL_CATEGORIES)
     random.shuffle(all_categories)
     
+    # 카테고리 요청은 서로 독립적이므로 한꺼번에 동시 요청 (총 시간 ≈ 가장 느린 응답)
+    fetched = prefetch_categories(all_categories)
+    
     for category in all_categories:
         if len(news_items) >= count + backup_count:
             break
             
         try:
-            response = requests.get(
-                "https://newsdata.io/api/1/latest",
-                params={
-                    "apikey": NEWSDATA_API_KEY,
-                    "language": "en",
-                    "category": category,
-                    "prioritydomain": "top",
-                    "size": 10  # 무료 플랜 최대
-                },
-                timeout=30
-            )
+            result = fetched[category]
+            if isinstance(result, Exception):
+                raise result
+            status_code, data = result
             
-            if response.status_code != 200:
-                print(f"  [WARN] {category}: API error {response.status_code}")
+            if status_code != 200:
+                print(f"  [WARN] {category}: API error {status_code}")
                 continue
             
-            data = response.json()
             if data.get("status") != "success":
                 continue
             
-            for article in data.get("results", []):
-                news = {
-                    "title": article.get("title", ""),
-                    "description": article.get("description", "") or article.get("content", ""),
-                    "source": article.get("source_name", ""),
-                    "category": CATEGORY_NAMES.get(category, category.title()),
-                    "image_url": article.get("image_url", ""),
-                    "link": article.get("link", ""),
-                }
-                
-                news_id = get_news_id(news)
-                
-                # 중복 체크
-                if news_id in used_news:
-                    continue
-                
-                # 신뢰도 높은 언론사 우선 (없으면 아무거나)
-                source_lower = news['source'].lower()
-                is_trusted = any(trusted in source_lower for trusted in TRUSTED_SOURCES)
-                
-                # 제목/설명 품질 체크
-                if len(news['title']) < 20 or not news['description']:
-                    continue
-                
+            for news in filter_articles(data, category, used_news):
                 # 이미 같은 카테고리 뉴스가 있으면 스킵 (다양성)
-                if any(n.get('category') == news['category'] for n in news_items):
+                if news['category'] in seen_categories:
                     continue
                 
                 news_items.append(news)
-                trusted_mark = "★" if is_trusted else ""
+                seen_categories.add(news['category'])
+                trusted_mark = "★" if news['is_trusted'] else ""
                 print(f"  [OK] {category}: {news['title'][:40]}... {trusted_mark}{news['source']}")
                 break  # 카테고리당 1개만
                 
@@ -764,15 +1036,11 @@ def fetch_global_news_with_backup(count: int, backup_count: int = 5) -> list:
             continue
     
     if len(news_items) < count:
-        raise Exception(f"Not enough news fetched: {len(news_items)} (need {count}). Try clearing used_news.json")
-    
-    print(f"  [OK] Total: {len(news_items)} articles from {len(news_items)} categories")
-    return news_items
+        raise Exception(f"Not enough news fetched: {len(news_items)} (need {count}). Try clearing {USED_NEWS_FILE_DAILY.name}")
     
     # 선택된 카테고리 출력
     selected_categories = [n.get('category', 'Unknown') for n in news_items]
-    print(f"  [OK] Fetched {len(news_items)} articles: {', '.join(selected_categories[:count])}")
-    
+    print(f"  [OK] Total: {len(news_items)} articles: {', '.join(selected_categories[:count])}")
     return news_items
 
 
@@ -836,21 +1104,22 @@ Structure:
 
 Output ONLY the narration."""
     
-    response = requests.post(
+    response = SESSION.post(
         f"{OPENAI_API_BASE}/chat/completions",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+        headers=OPENAI_HEADERS,
         json={
             "model": "gpt-5-mini",
             "messages": [{"role": "system", "content": system_prompt},
                         {"role": "user", "content": f"Create narration:\n\n{news_text}"}],
             "max_completion_tokens": 800 if style == "long" else 500,
-            "reasoning_effort": "minimal"
+            "reasoning_effort": "minimal",
+            "prompt_cache_key": f"news-script-{style}"
         },
         timeout=30
     )
     
     if response.status_code == 200:
-        return response.json()["choices"][0]["message"]["content"].strip()
+        return json_loads(response.content)["choices"][0]["message"]["content"].strip()
     raise Exception(f"Script generation failed: {response.text}")
 
 
@@ -858,8 +1127,6 @@ def generate_segmented_narration(news_list: list, style: str = "long", is_saturd
     """Generate narration segments per news for synced video - returns list of {text, news_index}"""
     
     # 다양한 인트로/아웃트로 (랜덤 선택)
-    import random
-    
     if is_saturday:
         outros = [
             "That's the week in news. See you Monday!",
@@ -901,39 +1168,73 @@ def generate_segmented_narration(news_list: list, style: str = "long", is_saturd
     segments.append({"text": intro, "type": "intro", "news_index": -1})
     
     # 각 뉴스별 나레이션
-    for i, news in enumerate(news_list):
-        news_text = f"{news['title']}: {news.get('description', '')[:150]}"
-        
-        if style == "long":
-            system_prompt = """Write 2-3 sentences narration for this single news story.
+    if style == "long":
+        system_prompt = """Write 2-3 sentences narration for this single news story.
 - Include brief context
 - Professional news anchor tone
 - Under 50 words
 Output ONLY the narration, no intro or outro."""
-        else:
-            system_prompt = """Write 1 sentence narration for this news.
+    else:
+        system_prompt = """Write 1 sentence narration for this news.
 - Just the key point
 - 15-16 words
 Output ONLY the narration."""
-        
-        response = requests.post(
+    
+    def narrate(news: dict) -> str:
+        news_text = f"{news['title']}: {news.get('description', '')[:150]}"
+        response = SESSION.post(
             f"{OPENAI_API_BASE}/chat/completions",
-            headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+            headers=OPENAI_HEADERS,
             json={
                 "model": "gpt-5-mini",
                 "messages": [{"role": "system", "content": system_prompt},
                             {"role": "user", "content": news_text}],
                 "max_completion_tokens": 100,
-                "reasoning_effort": "minimal"
+                "reasoning_effort": "minimal",
+                "prompt_cache_key": f"news-segment-{style}"
             },
             timeout=30
         )
         
         if response.status_code == 200:
-            narration = response.json()["choices"][0]["message"]["content"].strip()
-        else:
-            narration = news['title']
-        
+            return json_loads(response.content)["choices"][0]["message"]["content"].strip()
+        return news['title']
+    
+    def narrate_batch() -> list:
+        """모든 뉴스 나레이션을 한 번의 요청으로 - 번호 줄 수가 맞지 않으면 None"""
+        numbered = "\n".join(f"{i}. {n['title']}: {n.get('description', '')[:150]}" for i, n in enumerate(news_list, 1))
+        response = SESSION.post(
+            f"{OPENAI_API_BASE}/chat/completions",
+            headers=OPENAI_HEADERS,
+            json={
+                "model": "gpt-5-mini",
+                "messages": [{"role": "system", "content": f"""{system_prompt}
+
+There are {len(news_list)} numbered news stories. Write one narration per story.
+- Output EXACTLY {len(news_list)} numbered lines (1. 2. 3. ...), one line per story, same order
+- Do NOT merge or skip any story"""},
+                            {"role": "user", "content": numbered}],
+                "max_completion_tokens": 100 * len(news_list),
+                "reasoning_effort": "minimal",
+                "prompt_cache_key": f"news-segment-{style}"
+            },
+            timeout=60
+        )
+        if response.status_code != 200:
+            return None
+        content = json_loads(response.content)["choices"][0]["message"]["content"]
+        matches = [NUMBERED_LINE_RE.match(line.strip()) for line in content.split("\n") if line.strip()]
+        narrations = [m.group(1).strip() for m in matches if m]
+        return narrations if len(narrations) == len(news_list) else None
+    
+    # 한 번의 요청으로 전체 생성 (N번 왕복 → 1번), 줄 수가 어긋나면 뉴스별 요청을 동시에 호출
+    try:
+        narrations = narrate_batch() if len(news_list) > 1 else None
+    except requests.RequestException:
+        narrations = None
+    if narrations is None:
+        narrations = run_concurrent(narrate, news_list)
+    for i, narration in enumerate(narrations):
         segments.append({"text": narration, "type": "news", "news_index": i})
     
     # 아웃트로
@@ -942,76 +1243,141 @@ Output ONLY the narration."""
     return segments
 
 
-def generate_segmented_audio(segments: list, output_dir: Path, prefix: str, voice: str = "marin") -> list:
-    """Generate TTS for each segment and return list with durations"""
+def run_ffmpeg(cmd: list, error_label: str = "FFmpeg error", stdin_data: str = None):
+    """ffmpeg 실행 - stdout은 버리고 stderr는 바이트로만 받아 두었다가 실패했을 때만 디코딩
+    
+    stdin_data: CONCAT_STDIN 입력으로 넘길 concat 목록 (임시 목록 파일 없이 파이프로 전달)
+    """
+    result = subprocess.run(cmd, input=stdin_data.encode("utf-8") if stdin_data is not None else None,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise Exception(f"{error_label}: {result.stderr[:500].decode('utf-8', 'replace')}")
+
+
+def concat_entry(path: Path) -> str:
+    """ffmpeg concat 목록 한 줄 - 슬래시 경로 + 작은따옴표 이스케이프 (경로에 ' 가 있어도 동작)
+    
+    절대경로만 있으면 되므로 resolve()(항목마다 realpath 시스템 콜) 대신 문자열 연산인 abspath 사용
+    file: 프로토콜을 명시 - 목록을 stdin(pipe:)으로 넘겨도 pipe: 기준 상대경로로 해석되지 않음
+    """
+    escaped = Path(os.path.abspath(path)).as_posix().replace("'", "'\\''")
+    return f"file 'file:{escaped}'\n"
+
+
+# MPEG 오디오 Layer III 프레임 헤더 테이블 - 버전 비트(3=MPEG1, 2=MPEG2, 0=MPEG2.5)별
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_BITRATES[0] = _MP3_BITRATES[2]
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _mp3_duration(buf: bytes):
+    """MP3 프레임 헤더를 따라가며 길이(초) 합산 - ffprobe 프로세스 없이 계산 (CBR/VBR 모두), 실패 시 None"""
+    pos = 0
+    if buf[:3] == b"ID3":
+        # ID3v2 태그 건너뜀 (synchsafe 정수 크기)
+        pos = 10 + ((buf[6] & 0x7F) << 21 | (buf[7] & 0x7F) << 14 | (buf[8] & 0x7F) << 7 | (buf[9] & 0x7F))
+    
+    total = 0.0
+    frames = 0
+    end = len(buf) - 4
+    while pos <= end:
+        b1, b2 = buf[pos + 1], buf[pos + 2]
+        version, layer = (b1 >> 3) & 3, (b1 >> 1) & 3
+        bitrate_idx, rate_idx = b2 >> 4, (b2 >> 2) & 3
+        if (buf[pos] != 0xFF or (b1 & 0xE0) != 0xE0 or version == 1 or layer != 1
+                or bitrate_idx in (0, 15) or rate_idx == 3):
+            pos += 1  # 싱크 워드가 아니면 다음 바이트부터 다시 탐색
+            continue
+        
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_idx]
+        samples = 1152 if version == 3 else 576
+        frame_len = samples // 8 * _MP3_BITRATES[version][bitrate_idx] * 1000 // sample_rate + ((b2 >> 1) & 1)
+        # 첫 프레임이 Xing/Info(VBR 정보) 헤더면 오디오가 아니므로 제외
+        if frames or not (b"Xing" in buf[pos:pos + 64] or b"Info" in buf[pos:pos + 64]):
+            total += samples / sample_rate
+        frames += 1
+        pos += frame_len
+    return total if frames else None
+
+
+# 오디오 길이 캐시 {(경로, mtime_ns, size): 초} - 같은 파일을 자막/영상 단계에서 다시 probe하지 않음
+# 실행 간에는 cache/durations/{내용 sha1}.txt 로 유지 - TTS 캐시에서 복사된 같은 오디오는 다음 실행에서도 probe 생략
+@lru_cache(maxsize=128)
+def _probe_duration(path_str: str, mtime_ns: int, size: int):
+    """미디어 길이(초) 조회 - (경로, mtime, 크기)가 키라서 파일이 바뀌면 다시 조회, 실패 시 None
     
-    # 뉴스 앵커 스타일 instructions
-    tts_instructions = "Speak in a clear, professional news anchor tone. Confident and authoritative, with natural pacing and slight emphasis on key words."
+    MP3는 프레임 헤더를 직접 읽고, 그 외 형식(또는 파싱 실패)만 ffprobe 실행
+    """
+    buf = Path(path_str).read_bytes()
+    dur_path = cached_file("durations", hashlib.sha1(buf).hexdigest(), ".txt")
+    try:
+        return float(dur_path.read_text())
+    except (OSError, ValueError):
+        pass
+    
+    duration = _mp3_duration(buf) if path_str.lower().endswith(".mp3") else None
+    if duration is None:
+        probe_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                     "-of", "default=noprint_wrappers=1:nokey=1", path_str]
+        try:
+            duration = float(subprocess.check_output(probe_cmd, stderr=subprocess.DEVNULL))
+        except (subprocess.CalledProcessError, ValueError):
+            return None
     
-    result = []
+    tmp_path = dur_path.with_name(dur_path.name + ".tmp")
+    tmp_path.write_text(str(duration))
+    os.replace(tmp_path, dur_path)
+    return duration
+
+
+def probe_duration(media_path: Path, default: float) -> float:
+    """미디어 길이(초) - 실패 시 default"""
+    try:
+        st = media_path.stat()
+    except OSError:
+        return default
+    duration = _probe_duration(os.path.abspath(media_path), st.st_mtime_ns, st.st_size)
+    return default if duration is None else duration
+
+
+def generate_segmented_audio(segments: list, output_dir: Path, prefix: str, voice: str = "marin") -> list:
+    """Generate TTS for each segment and return list with durations"""
     
-    for i, seg in enumerate(segments):
+    def _tts_one(item):
+        i, seg = item
         audio_path = output_dir / f"{prefix}_seg_{i:02d}.mp3"
         
-        response = requests.post(
-            f"{OPENAI_API_BASE}/audio/speech",
-            headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-            json={
-                "model": "gpt-4o-mini-tts",
-                "input": seg["text"],
-                "voice": voice,
-                "instructions": tts_instructions,
-                "response_format": "mp3"
-            },
-            timeout=60
-        )
+        request_tts(seg["text"], audio_path, voice, timeout=60, error_label=f"TTS Error segment {i}")
         
-        if response.status_code != 200:
-            raise Exception(f"TTS Error segment {i}: {response.text}")
-        
-        with open(audio_path, 'wb') as f:
-            f.write(response.content)
-        
-        # Get duration
-        probe_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                     "-of", "default=noprint_wrappers=1:nokey=1", str(audio_path)]
-        probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        duration = float(probe_result.stdout.strip()) if probe_result.stdout.strip() else 3.0
+        # Get duration - 같은 문장(인트로/아웃트로 등)은 디스크 캐시에 길이가 남아 있어 probe 생략
+        duration = probe_duration(audio_path, default=3.0)
         
-        result.append({
+        return {
             **seg,
             "audio_path": audio_path,
             "duration": duration
-        })
+        }
     
-    return result
+    # 세그먼트끼리 독립적이므로 동시에 요청 (결과는 세그먼트 순서 유지)
+    return run_concurrent(_tts_one, list(enumerate(segments)))
 
 
 def merge_audio_segments(segments: list, output_path: Path) -> Path:
     """Merge audio segments into one file"""
     
-    concat_file = output_path.parent / f"concat_audio_{output_path.stem}.txt"
-    with open(concat_file, 'w') as f:
-        for seg in segments:
-            abs_path = str(seg["audio_path"].resolve()).replace('\\', '/')
-            f.write(f"file '{abs_path}'\n")
-    
     cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat", "-safe", "0", "-i", str(concat_file),
+        *FFMPEG,
+        *CONCAT_STDIN,
         "-c", "copy",
         str(output_path)
     ]
+    run_ffmpeg(cmd, "FFmpeg merge error", stdin_data="".join(concat_entry(seg["audio_path"]) for seg in segments))
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    concat_file.unlink()
-    
-    if result.returncode != 0:
-        raise Exception(f"FFmpeg merge error: {result.stderr[:500]}")
-    
-    # Clean up segment files
-    for seg in segments:
-        seg["audio_path"].unlink()
+    # Clean up segment files (백그라운드)
+    discard_files(seg["audio_path"] for seg in segments)
     
     return output_path
 
@@ -1019,40 +1385,18 @@ def merge_audio_segments(segments: list, output_path: Path) -> Path:
 def generate_tts(text: str, output_path: Path, voice: str = "marin") -> Path:
     """Generate speech with OpenAI TTS - handles long text by chunking"""
     
-    # 뉴스 앵커 스타일 instructions
-    tts_instructions = "Speak in a clear, professional news anchor tone. Confident and authoritative, with natural pacing and slight emphasis on key words."
-    
     # TTS limit is 4096 characters
     MAX_CHARS = 4000
     
     if len(text) <= MAX_CHARS:
         # Short text - single request
-        response = requests.post(
-            f"{OPENAI_API_BASE}/audio/speech",
-            headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-            json={
-                "model": "gpt-4o-mini-tts",
-                "input": text,
-                "voice": voice,
-                "instructions": tts_instructions,
-                "response_format": "mp3"
-            },
-            timeout=120
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"TTS Error: {response.text}")
-        
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-        return output_path
+        return request_tts(text, output_path, voice)
     
     # Long text - split into chunks and merge
     print(f"    [INFO] Text too long ({len(text)} chars), splitting...")
     
     # Split by sentences
-    import re
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_SPLIT_RE.split(text)
     chunks = []
     current_chunk = ""
     
@@ -1066,160 +1410,197 @@ def generate_tts(text: str, output_path: Path, voice: str = "marin") -> Path:
     if current_chunk:
         chunks.append(current_chunk.strip())
     
-    # Generate audio for each chunk
-    temp_files = []
-    for i, chunk in enumerate(chunks):
+    # Generate audio for each chunk (청크끼리 독립적이므로 동시에 요청)
+    def synthesize_chunk(item):
+        i, chunk = item
         temp_path = output_path.parent / f"temp_audio_{i}.mp3"
-        
-        response = requests.post(
-            f"{OPENAI_API_BASE}/audio/speech",
-            headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-            json={
-                "model": "gpt-4o-mini-tts",
-                "input": chunk,
-                "voice": voice,
-                "instructions": tts_instructions,
-                "response_format": "mp3"
-            },
-            timeout=120
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"TTS Error chunk {i}: {response.text}")
-        
-        with open(temp_path, 'wb') as f:
-            f.write(response.content)
-        temp_files.append(temp_path)
+        return request_tts(chunk, temp_path, voice, error_label=f"TTS Error chunk {i}")
+    
+    temp_files = run_concurrent(synthesize_chunk, list(enumerate(chunks)))
     
     # Merge audio files with FFmpeg
-    concat_file = output_path.parent / "concat_audio.txt"
-    with open(concat_file, 'w') as f:
+    cmd = [*FFMPEG, *CONCAT_STDIN, "-c", "copy", str(output_path)]
+    try:
+        run_ffmpeg(cmd, "FFmpeg merge error", stdin_data="".join(concat_entry(temp_path) for temp_path in temp_files))
+    finally:
+        # Cleanup temp files
         for temp_path in temp_files:
-            f.write(f"file '{str(temp_path.resolve()).replace(chr(92), '/')}'\n")
+            temp_path.unlink()
+    
+    return output_path
+
+
+# 번역 system 프롬프트 - 고정 규칙을 앞에 두고 언어/줄 수는 맨 뒤에 붙임 (언어가 달라도 앞부분이 같아 프롬프트 캐시 적중)
+TRANSLATE_SYSTEM_PROMPT = """Translate numbered lines for video subtitles.
+
+RULES:
+- Translate each numbered line
+- Keep the same numbering (1. 2. 3. ...)
+- Keep translations concise
+- Do NOT merge or skip any line
+"""
+
+
+def _request_translation(lines: list, lang: str):
+    """번역 API 호출 - (원문과 같은 줄 수로 맞춘 번역, 응답 줄 수 일치 여부), 실패 시 (None, False)"""
+    num_lines = len(lines)
+    
+    # 번역용 텍스트: 번호 붙여서 명확하게
+    numbered_texts = [f"{i+1}. {text}" for i, text in enumerate(lines)]
+    
+    trans_response = SESSION.post(
+        f"{OPENAI_API_BASE}/chat/completions",
+        headers=OPENAI_HEADERS,
+        json={
+            "model": "gpt-5-mini",
+            "messages": [{
+                "role": "system",
+                "content": f"""{TRANSLATE_SYSTEM_PROMPT}
+Target language: {LANGUAGE_NAMES[lang]}
+Output EXACTLY {num_lines} numbered lines"""
+            }, {"role": "user", "content": "\n".join(numbered_texts)}],
+            "max_completion_tokens": 2000,
+            "reasoning_effort": "minimal",
+            "prompt_cache_key": "news-translate"
+        },
+        timeout=60
+    )
     
-    cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", str(concat_file),
-           "-c", "copy", str(output_path)]
-    subprocess.run(cmd, capture_output=True)
+    if trans_response.status_code != 200:
+        return None, False
     
-    # Cleanup temp files
-    concat_file.unlink()
-    for temp_path in temp_files:
-        temp_path.unlink()
+    raw_content = json_loads(trans_response.content)["choices"][0]["message"]["content"].strip()
     
-    return output_path
+    # 번호 제거하고 텍스트만 추출
+    texts = []
+    for line in raw_content.split('\n'):
+        line = line.strip()
+        if line:
+            # "1. 텍스트" 형식에서 번호 제거
+            match = NUMBERED_LINE_RE.match(line)
+            if match:
+                texts.append(match.group(1))
+            else:
+                texts.append(line)
+    
+    # 줄 수 보정
+    exact = len(texts) == num_lines
+    if len(texts) < num_lines:
+        texts.extend(lines[len(texts):])
+    elif len(texts) > num_lines:
+        texts = texts[:num_lines]
+    return texts, exact
+
 
+# 언어별 번역 캐시 (같은 실행 안에서 Shorts/Video 자막이 파일을 다시 읽지 않도록 메모리에 유지)
+_TRANSLATION_CACHE = {}
+# Shorts/Video 자막이 서로 다른 풀에서 동시에 번역하므로 언어별로 캐시 조회/갱신/저장을 직렬화 (API 요청 중에는 잠그지 않음)
+_TRANSLATION_LOCKS = {lang: threading.Lock() for lang in LANGUAGES}
 
-def generate_subtitles(script: str, output_dir: Path, prefix: str, audio_path: Path = None) -> dict:
-    """Generate SRT subtitles in multiple languages - 직접 타이밍 계산"""
+
+def _translate_lines(lines: list, lang: str) -> list:
+    """자막 줄 번역 - 원문과 같은 줄 수로 맞춰 반환 (API 실패 시 원문)
+    
+    번역은 cache/translations/{lang}.json에 줄 단위로 저장 → 반복 문구(인트로/아웃트로, 재등장 뉴스)는
+    API 없이 재사용하고, 캐시에 없는 줄만 한 번에 요청
+    """
+    cache_path = cached_file("translations", lang, ".json")
+    keys = [cache_key("gpt-5-mini", text) for text in lines]
+    lock = _TRANSLATION_LOCKS[lang]
+    
+    with lock:
+        cache = _TRANSLATION_CACHE.get(lang)
+        if cache is None:
+            try:
+                cache = json_loads(cache_path.read_bytes())
+            except (OSError, ValueError):
+                cache = {}
+            _TRANSLATION_CACHE[lang] = cache
+        # 캐시에 있는 줄은 지금 값을 잡아 둠 (요청 중에 다른 스레드가 잘라낼 수 있음)
+        # 캐시에 없는 줄만, 같은 문장이 여러 번 나와도 한 번만 요청
+        found, missing = {}, {}
+        for key, text in zip(keys, lines):
+            if key in cache:
+                found[key] = cache[key]
+            else:
+                missing.setdefault(key, text)
+        if not missing:
+            return [found[key] for key in keys]
+    
+    texts, exact = _request_translation(list(missing.values()), lang)
+    
+    if texts is None:
+        return [found.get(key, text) for key, text in zip(keys, lines)]
+    new_entries = dict(zip(missing, texts))
+    found.update(new_entries)
+    result = [found[key] for key in keys]
+    if not exact:
+        return result
+    
+    with lock:
+        # 요청하는 동안 다른 스레드가 캐시를 갱신/교체했을 수 있으므로 다시 읽음
+        cache = _TRANSLATION_CACHE[lang]
+        # 줄 수가 맞을 때만 저장 (밀린 번역이 캐시에 남지 않도록)
+        # 이번에 쓴 줄은 뒤로 옮기고 오래된 줄부터 잘라서 파일이 무한히 커지지 않게 함
+        cache.update(new_entries)
+        for key in dict.fromkeys(keys):
+            cache[key] = cache.pop(key, found[key])
+        if len(cache) > TRANSLATION_CACHE_MAX:
+            cache = dict(list(cache.items())[-TRANSLATION_CACHE_MAX:])
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_bytes(json_dumps(cache))
+        os.replace(tmp_path, cache_path)
+        _TRANSLATION_CACHE[lang] = cache
+    return result
+
+
+def translate_subtitles(lines: list) -> dict:
+    """자막 번역 {lang: [줄, ...]} - 언어별 요청은 서로 독립적이므로 동시에 실행"""
+    targets = [lang for lang in LANGUAGES if lang != "en"]
+    translated = run_concurrent(lambda lang: _translate_lines(lines, lang), targets)
+    return {"en": list(lines), **dict(zip(targets, translated))}
+
+
+def generate_subtitles(script: str, output_dir: Path, prefix: str, audio_path: Path = None,
+                       audio_duration: float = None) -> dict:
+    """Generate SRT subtitles in multiple languages - 직접 타이밍 계산
+    
+    audio_duration: 이미 알고 있는 오디오 길이(초) - 없으면 audio_path에서 조회
+    """
     print(f"  Generating subtitles...")
     
     # 실제 오디오 길이 가져오기
-    audio_duration = 60.0
-    if audio_path and audio_path.exists():
-        probe_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                     "-of", "default=noprint_wrappers=1:nokey=1", str(audio_path)]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        if result.stdout.strip():
-            audio_duration = float(result.stdout.strip())
+    if audio_duration is None:
+        audio_duration = 60.0
+        if audio_path and audio_path.exists():
+            audio_duration = probe_duration(audio_path, default=60.0)
     
     # 스크립트 정리: 여러 줄바꿈을 공백으로 변환
     clean_script = ' '.join(script.strip().split())
     
     # 문장 단위로 분할 (마침표, 느낌표, 물음표 뒤에서)
-    import re
-    sentences = re.split(r'(?<=[.!?])\s+', clean_script)
+    sentences = SENTENCE_SPLIT_RE.split(clean_script)
     sentences = [s.strip() for s in sentences if s.strip()]
     
     if not sentences:
         return {}
     
     # 각 문장 길이 계산 (영어 기준 - TTS가 영어이므로)
-    total_chars = sum(len(s) for s in sentences)
+    lengths = [len(s) for s in sentences]
     
-    # 타이밍 계산 (문자 수 비율로 분배)
-    segments = []
-    current_time = 0.0
-    
-    for sentence in sentences:
-        char_ratio = len(sentence) / total_chars
-        duration = char_ratio * audio_duration
-        
-        start_time = current_time
-        end_time = current_time + duration
-        
-        segments.append({
-            "start": format_srt_time(start_time),
-            "end": format_srt_time(end_time),
-            "text": sentence
-        })
-        
-        current_time = end_time
+    # 타이밍 계산 (문자 수 비율로 분배 → build_srt_segments에서 누적합 한 번)
+    sec_per_char = audio_duration / sum(lengths)
+    segments = build_srt_segments([n * sec_per_char for n in lengths], sentences)
     
     srt_files = {}
-    num_segments = len(segments)
+    translations = translate_subtitles([seg['text'] for seg in segments])
     
     # Generate for each language
     for lang in LANGUAGES:
-        if lang == "en":
-            texts = [seg['text'] for seg in segments]
-        else:
-            # Translate - 정확히 같은 줄 수 유지 강조
-            original_texts = [seg['text'] for seg in segments]
-            
-            # 번역용 텍스트: 번호 붙여서 명확하게
-            numbered_texts = [f"{i+1}. {text}" for i, text in enumerate(original_texts)]
-            
-            trans_response = requests.post(
-                f"{OPENAI_API_BASE}/chat/completions",
-                headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-                json={
-                    "model": "gpt-5-mini",
-                    "messages": [{
-                        "role": "system",
-                        "content": f"""Translate to {LANGUAGE_NAMES[lang]} for video subtitles.
-
-RULES:
-- Translate each numbered line
-- Keep the same numbering (1. 2. 3. ...)
-- Output EXACTLY {num_segments} numbered lines
-- Keep translations concise
-- Do NOT merge or skip any line"""
-                    }, {"role": "user", "content": "\n".join(numbered_texts)}],
-                    "max_completion_tokens": 2000,
-                    "reasoning_effort": "minimal"
-                },
-                timeout=60
-            )
-            
-            if trans_response.status_code == 200:
-                raw_content = trans_response.json()["choices"][0]["message"]["content"].strip()
-                
-                # 번호 제거하고 텍스트만 추출
-                texts = []
-                for line in raw_content.split('\n'):
-                    line = line.strip()
-                    if line:
-                        # "1. 텍스트" 형식에서 번호 제거
-                        match = re.match(r'^\d+\.\s*(.+)$', line)
-                        if match:
-                            texts.append(match.group(1))
-                        else:
-                            texts.append(line)
-                
-                # 줄 수 보정
-                if len(texts) < num_segments:
-                    texts.extend(original_texts[len(texts):])
-                elif len(texts) > num_segments:
-                    texts = texts[:num_segments]
-            else:
-                texts = [seg['text'] for seg in segments]
+        texts = translations[lang]
         
         srt_path = output_dir / f"{prefix}_subtitles_{lang}.srt"
-        with open(srt_path, 'w', encoding='utf-8') as f:
-            for i, seg in enumerate(segments):
-                text = texts[i] if i < len(texts) else seg['text']
-                f.write(f"{i+1}\n{seg['start']} --> {seg['end']}\n{text}\n\n")
-        srt_files[lang] = srt_path
+        srt_files[lang] = write_srt(srt_path, segments, texts)
     
     print(f"    [OK] Subtitles: {', '.join(LANGUAGES)}")
     return srt_files
@@ -1229,191 +1610,302 @@ def generate_subtitles_from_segments(audio_segments: list, output_dir: Path, pre
     """Generate SRT subtitles from audio segments with accurate timing"""
     print(f"  Generating subtitles from segments...")
     
-    import re
-    
     # 세그먼트별 시작/끝 시간 계산
-    segments = []
-    current_time = 0.0
-    
-    for seg in audio_segments:
-        start_time = current_time
-        end_time = current_time + seg["duration"]
-        
-        segments.append({
-            "start": format_srt_time(start_time),
-            "end": format_srt_time(end_time),
-            "text": seg["text"]
-        })
-        
-        current_time = end_time
+    segments = build_srt_segments([seg["duration"] for seg in audio_segments],
+                                  [seg["text"] for seg in audio_segments])
     
     srt_files = {}
-    num_segments = len(segments)
+    translations = translate_subtitles([seg['text'] for seg in segments])
     
     for lang in LANGUAGES:
-        if lang == "en":
-            texts = [seg['text'] for seg in segments]
-        else:
-            # 번역
-            original_texts = [seg['text'] for seg in segments]
-            numbered_texts = [f"{i+1}. {text}" for i, text in enumerate(original_texts)]
-            
-            trans_response = requests.post(
-                f"{OPENAI_API_BASE}/chat/completions",
-                headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
-                json={
-                    "model": "gpt-5-mini",
-                    "messages": [{
-                        "role": "system",
-                        "content": f"""Translate to {LANGUAGE_NAMES[lang]} for video subtitles.
-RULES:
-- Translate each numbered line
-- Keep the same numbering (1. 2. 3. ...)
-- Output EXACTLY {num_segments} numbered lines
-- Keep translations concise"""
-                    }, {"role": "user", "content": "\n".join(numbered_texts)}],
-                    "max_completion_tokens": 2000,
-                    "reasoning_effort": "minimal"
-                },
-                timeout=60
-            )
-            
-            if trans_response.status_code == 200:
-                raw_content = trans_response.json()["choices"][0]["message"]["content"].strip()
-                texts = []
-                for line in raw_content.split('\n'):
-                    line = line.strip()
-                    if line:
-                        match = re.match(r'^\d+\.\s*(.+)$', line)
-                        if match:
-                            texts.append(match.group(1))
-                        else:
-                            texts.append(line)
-                
-                if len(texts) < num_segments:
-                    texts.extend(original_texts[len(texts):])
-                elif len(texts) > num_segments:
-                    texts = texts[:num_segments]
-            else:
-                texts = [seg['text'] for seg in segments]
+        texts = translations[lang]
         
         srt_path = output_dir / f"{prefix}_subtitles_{lang}.srt"
-        with open(srt_path, 'w', encoding='utf-8') as f:
-            for i, seg in enumerate(segments):
-                text = texts[i] if i < len(texts) else seg['text']
-                f.write(f"{i+1}\n{seg['start']} --> {seg['end']}\n{text}\n\n")
-        srt_files[lang] = srt_path
+        srt_files[lang] = write_srt(srt_path, segments, texts)
     
     print(f"    [OK] Subtitles: {', '.join(LANGUAGES)}")
     return srt_files
 
 
+def write_srt(srt_path: Path, segments: list, texts: list) -> Path:
+    """SRT 파일 쓰기 - 본문 전체를 한 번에 만들어 한 번만 기록"""
+    body = "".join(
+        f"{i}\n{seg['start']} --> {seg['end']}\n{texts[i-1] if i <= len(texts) else seg['text']}\n\n"
+        for i, seg in enumerate(segments, 1)
+    )
+    srt_path.write_text(body, encoding='utf-8')
+    return srt_path
+
+
+def build_srt_segments(durations: list, texts: list) -> list:
+    """구간 길이 목록 -> [{start, end, text}, ...] (시작/끝은 누적합 한 번으로 계산)"""
+    ends = list(accumulate(durations))
+    starts = [0.0] + ends[:-1]
+    return [
+        {"start": format_srt_time(start), "end": format_srt_time(end), "text": text}
+        for start, end, text in zip(starts, ends, texts)
+    ]
+
+
+@lru_cache(maxsize=4096)
 def format_srt_time(seconds: float) -> str:
-    """초를 SRT 타임코드로 변환 (HH:MM:SS,mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    """초를 SRT 타임코드로 변환 (HH:MM:SS,mmm) - 앞 자막의 끝 = 다음 자막의 시작이라 캐시"""
+    # int()는 버림이라 1.005 * 1000 = 1004.999... → 1004ms가 됨 - 가장 가까운 ms로 반올림
+    secs, millis = divmod(round(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
+@lru_cache(maxsize=1)
+def video_codec_args() -> tuple:
+    """이미지/엔딩 클립 공통 영상 인코딩 인자 - 하드웨어 인코더가 있으면 CPU 대신 사용 (프로세스당 한 번만 확인)"""
+    forced = os.environ.get("VIDEO_ENCODER")
+    candidates = [forced, "libx264"] if forced in VIDEO_ENCODER_ARGS else list(VIDEO_ENCODER_ARGS)
+    for encoder in candidates:
+        args = ("-c:v", encoder, *VIDEO_ENCODER_ARGS[encoder], "-r", str(VIDEO_FPS))
+        if encoder == "libx264":
+            return args
+        # ffmpeg -encoders 목록에 있어도 GPU/드라이버가 없으면 실패하므로 짧은 테스트 인코딩으로 확인
+        test_cmd = [*FFMPEG, "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                    "-vf", f"setsar=1:1{VIDEO_HW_UPLOAD.get(encoder, '')}", *args, "-f", "null", "-"]
+        if subprocess.run(test_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0:
+            print(f"    [INFO] Video encoder: {encoder}")
+            return args
+
+
+def video_filter(width: int, height: int, scale: bool = True) -> str:
+    """이미지/엔딩 클립 공통 영상 필터 (스케일 + 선택된 인코더에 필요한 GPU 업로드)
+    
+    scale=False: 이미 영상 해상도로 저장된 이미지 - 프레임마다 도는 스케일러 생략
+    """
+    scale_filter = f"scale={width}:{height}," if scale else ""
+    return f"{scale_filter}setsar=1:1{VIDEO_HW_UPLOAD.get(video_codec_args()[1], '')}"
+
+
+@lru_cache(maxsize=8)
+def _file_sha256(path_str: str, mtime_ns: int, size: int) -> str:
+    """파일 내용 sha256 - (경로, mtime, 크기)가 같으면 다시 읽지 않음"""
+    return hashlib.sha256(Path(path_str).read_bytes()).hexdigest()
+
+
+def prewarm_ending_clips(jobs: list):
+    """[(엔딩 이미지, 해상도, 길이), ...] 엔딩 클립을 백그라운드에서 미리 캐시 (이미지/TTS 생성과 겹쳐서 실행)
+    
+    실패해도 무시 - 렌더링 때 get_ending_clip이 다시 시도
+    """
+    def warm(ending_image, resolution, duration):
+        try:
+            get_ending_clip(ending_image, resolution, duration)
+        except Exception as e:
+            print(f"    [WARN] Ending clip prewarm failed: {e}")
+    
+    for ending_image, resolution, duration in jobs:
+        if ending_image.exists():
+            submit_postprocess(warm, ending_image, resolution, duration)
+
+
+def get_ending_clip(ending_image: Path, resolution: tuple, duration: float) -> Path:
+    """엔딩 이미지를 영상 클립(mp4, 무음 오디오 포함)으로 미리 인코딩
+    
+    sha256(PNG) + 해상도 + 길이 + 인코딩 설정이 같으면 캐시된 클립 재사용
+    """
+    width, height = resolution
+    st = ending_image.stat()
+    key = cache_key(_file_sha256(os.path.abspath(ending_image), st.st_mtime_ns, st.st_size), width, height, duration,
+                    *video_codec_args(), *AUDIO_CODEC_ARGS)
+    clip_path = cached_file("ending", key, ".mp4")
+    if clip_path.exists():
+        return clip_path
+    
+    tmp_path = clip_path.with_name(f"{clip_path.stem}.tmp.mp4")
+    cmd = [
+        *FFMPEG,
+        "-loop", "1", "-framerate", str(VIDEO_FPS), "-i", str(ending_image),
+        "-f", "lavfi", "-i", "anullsrc=channel_layout=mono:sample_rate=48000",
+        "-vf", video_filter(width, height),
+        *video_codec_args(), *AUDIO_CODEC_ARGS,
+        "-t", str(duration),
+        str(tmp_path)
+    ]
+    try:
+        run_ffmpeg(cmd, "FFmpeg ending clip error")
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, clip_path)
+    print(f"    [OK] Ending clip cached: {clip_path.name}")
+    return clip_path
+
+
+def append_ending_clip(main_path: Path, ending_clip: Path, output_path: Path) -> Path:
+    """본편 뒤에 미리 인코딩된 엔딩 클립 붙이기 (concat demuxer, -c copy)"""
+    cmd = [
+        *FFMPEG,
+        *CONCAT_STDIN,
+        "-c", "copy", "-movflags", "+faststart",
+        str(output_path)
+    ]
+    try:
+        run_ffmpeg(cmd, "FFmpeg concat error", stdin_data=concat_entry(main_path) + concat_entry(ending_clip))
+    finally:
+        main_path.unlink()
+    
+    return output_path
+
+
+def encode_still_clips(timeline: list, resolution: tuple, work_dir: Path) -> list:
+    """[(이미지, 길이), ...] → 이미지별 짧은 H.264 클립 (동시에 인코딩, 순서 유지)
+    
+    프레임 경계는 누적 시간 기준으로 반올림 - 클립이 많아도 오디오와 어긋나지 않음
+    """
+    width, height = resolution
+    frame_ends = [round(t * VIDEO_FPS) for t in accumulate(duration for _, duration in timeline)]
+    frame_counts = [end - start for start, end in zip([0] + frame_ends[:-1], frame_ends)]
+    jobs = [(image, frames) for (image, _), frames in zip(timeline, frame_counts) if frames > 0]
+    
+    def encode(item):
+        i, (image, frames) = item
+        clip_path = work_dir / f"still_{i:03d}.mp4"
+        with Image.open(image) as img:  # 헤더만 읽음
+            needs_scale = img.size != (width, height)
+        cmd = [
+            *FFMPEG,
+            "-loop", "1", "-framerate", str(VIDEO_FPS), "-i", str(image),
+            "-vf", video_filter(width, height, scale=needs_scale),
+            *video_codec_args(), "-threads", "0",
+            "-frames:v", str(frames),
+            str(clip_path)
+        ]
+        with ENCODE_SLOTS:
+            run_ffmpeg(cmd, "FFmpeg still clip error")
+        return clip_path
+    
+    # x264도 내부적으로 멀티스레드이므로 동시 인코딩 수는 코어 수의 절반 정도로 (ENCODE_SLOTS로 영상 간 합산 제한)
+    return run_concurrent(encode, list(enumerate(jobs)), max_workers=ENCODE_CONCURRENCY)
+
+
+def render_slideshow(timeline: list, audio_files: list, duration: float, resolution: tuple,
+                     output_path: Path, ending_image: Path = None, ending_duration: float = 0) -> Path:
+    """이미지 타임라인 + 오디오 → 영상
+    
+    이미지마다 짧은 클립으로 한 번씩만 인코딩한 뒤 concat demuxer로 -c:v copy,
+    오디오만 AAC 인코딩 (전체 길이를 다시 H.264 인코딩하지 않음).
+    엔딩 이미지는 캐시된 엔딩 클립을 뒤에 붙임
+    """
+    has_ending = bool(ending_image and ending_image.exists())
+    main_path = output_path.with_name(f"{output_path.stem}_main.mp4") if has_ending else output_path
+    work_dir = output_path.parent / f"stills_{output_path.stem}"
+    work_dir.mkdir(exist_ok=True)
+    
+    try:
+        clips = encode_still_clips(timeline, resolution, work_dir)
+        
+        # 오디오 파일이 여러 개면 (세그먼트) concat demuxer로 이어서 읽음 (영상 클립 목록이 stdin을 쓰므로 오디오 목록은 파일)
+        if len(audio_files) == 1:
+            audio_input = [*INPUT_QUEUE_ARGS, "-i", str(audio_files[0])]
+        else:
+            audio_concat_file = work_dir / "concat_audio.txt"
+            audio_concat_file.write_text("".join(concat_entry(path) for path in audio_files), encoding="utf-8")
+            audio_input = [*INPUT_QUEUE_ARGS, "-f", "concat", "-safe", "0", "-i", str(audio_concat_file)]
+        
+        cmd = [
+            *FFMPEG,
+            *INPUT_QUEUE_ARGS, *CONCAT_STDIN,
+            *audio_input,
+            "-map", "0:v", "-map", "1:a",
+            "-c:v", "copy", *AUDIO_CODEC_ARGS, "-threads", "0",
+            "-t", str(duration),
+            # 최종 파일만 moov를 앞으로 (업로드 후 바로 재생/처리 시작) - 엔딩을 붙일 중간 파일은 생략
+            *([] if has_ending else ["-movflags", "+faststart"]),
+            str(main_path)
+        ]
+        run_ffmpeg(cmd, stdin_data="".join(concat_entry(clip) for clip in clips))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    if has_ending:
+        append_ending_clip(main_path, get_ending_clip(ending_image, resolution, ending_duration), output_path)
+    
+    return output_path
+
+
 def create_synced_video(news_images: dict, audio_segments: list, audio_path: Path, output_path: Path, 
                         resolution: tuple, ending_image: Path = None, images_per_news: int = 3) -> Path:
     """Create video with images synced to audio segments
     
     news_images: {news_index: [img1, img2, img3], ...}
-    audio_segments: [{news_index, duration, text, type}, ...]
+    audio_segments: [{news_index, duration, text, type, audio_path}, ...]
+    audio_path: 병합된 오디오 (None이면 세그먼트 파일들을 렌더링 중에 바로 이어 읽음)
     """
     
     width, height = resolution
     is_shorts = width < height
-    ending_duration = 2.0 if is_shorts else 3.0
+    ending_duration = ENDING_SECONDS_SHORTS if is_shorts else ENDING_SECONDS_VIDEO
     
     # Build image sequence with proper durations
-    concat_file = output_path.parent / f"concat_{output_path.stem}.txt"
-    
-    with open(concat_file, 'w') as f:
-        for seg in audio_segments:
-            news_idx = seg["news_index"]
-            duration = seg["duration"]
-            seg_type = seg["type"]
-            
-            if seg_type == "news" and news_idx in news_images:
-                # 뉴스 세그먼트: 해당 뉴스의 이미지들을 균등 분배
-                images = news_images[news_idx]
-                duration_per_img = duration / len(images)
-                
-                for img in images:
-                    abs_path = str(img.resolve()).replace('\\', '/')
-                    f.write(f"file '{abs_path}'\n")
-                    f.write(f"duration {duration_per_img}\n")
+    timeline = []
+    for seg in audio_segments:
+        news_idx = seg["news_index"]
+        duration = seg["duration"]
+        seg_type = seg["type"]
+        
+        if seg_type == "news" and news_idx in news_images:
+            # 뉴스 세그먼트: 해당 뉴스의 이미지들을 균등 분배
+            images = news_images[news_idx]
+            duration_per_img = duration / len(images)
+            timeline.extend((img, duration_per_img) for img in images)
+        else:
+            # 인트로/아웃트로: 첫 번째 또는 마지막 뉴스 이미지 사용
+            if seg_type == "intro" and 0 in news_images:
+                img = news_images[0][0]  # 첫 뉴스 첫 이미지
+            elif seg_type == "outro" and news_images:
+                last_idx = max(news_images.keys())
+                img = news_images[last_idx][-1]  # 마지막 뉴스 마지막 이미지
             else:
-                # 인트로/아웃트로: 첫 번째 또는 마지막 뉴스 이미지 사용
-                if seg_type == "intro" and 0 in news_images:
-                    img = news_images[0][0]  # 첫 뉴스 첫 이미지
-                elif seg_type == "outro" and news_images:
-                    last_idx = max(news_images.keys())
-                    img = news_images[last_idx][-1]  # 마지막 뉴스 마지막 이미지
-                else:
-                    continue
-                
-                abs_path = str(img.resolve()).replace('\\', '/')
-                f.write(f"file '{abs_path}'\n")
-                f.write(f"duration {duration}\n")
-        
-        # 엔딩 이미지
-        if ending_image and ending_image.exists():
-            abs_path = str(ending_image.resolve()).replace('\\', '/')
-            f.write(f"file '{abs_path}'\n")
-            f.write(f"duration {ending_duration}\n")
-            f.write(f"file '{abs_path}'\n")  # FFmpeg concat 요구사항
-    
-    # 총 길이 계산
+                continue
+            timeline.append((img, duration))
+    
+    # 총 길이 계산 (엔딩은 미리 인코딩된 클립을 뒤에 붙임)
+    has_ending = bool(ending_image and ending_image.exists())
     total_audio = sum(seg["duration"] for seg in audio_segments)
-    total_duration = total_audio + ending_duration if (ending_image and ending_image.exists()) else total_audio
+    total_duration = total_audio + ending_duration if has_ending else total_audio
     
     print(f"    [DEBUG] Synced video: {len(audio_segments)} segments, {total_audio:.1f}s audio, {total_duration:.1f}s total")
     
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat", "-safe", "0", "-i", str(concat_file),
-        "-i", str(audio_path),
-        "-c:v", "libx264",
-        "-vf", f"scale={width}:{height},setsar=1:1",
-        "-c:a", "aac", "-b:a", "192k",
-        "-t", str(total_duration),
-        "-pix_fmt", "yuv420p", "-r", "30",
-        str(output_path)
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    concat_file.unlink()
-    
-    if result.returncode != 0:
-        raise Exception(f"FFmpeg error: {result.stderr[:500]}")
+    # 오디오 입력 - 병합 파일이 없으면 세그먼트 mp3를 렌더링 중에 바로 이어 읽음
+    audio_files = [audio_path] if audio_path else [seg["audio_path"] for seg in audio_segments]
     
-    return output_path
+    return render_slideshow(timeline, audio_files, total_audio, resolution, output_path, ending_image, ending_duration)
+
+
+def generate_shorts_opening(opening_path: Path, breaking_news: dict = None, top_news: dict = None, total_news_count: int = 6) -> Path:
+    """Shorts 오프닝 이미지 - 속보면 breaking 스타일, 아니면 첫 번째 뉴스 헤드라인 강조"""
+    if breaking_news:
+        return generate_breaking_opening_image(opening_path, breaking_news, "vertical")
+    top_headline = top_news.get('title', '')[:50] if top_news else "Today's Top Stories"
+    return generate_opening_image(opening_path, "vertical", top_headline=top_headline, total_count=total_news_count)
 
 
-def create_video(images: list, audio_path: Path, output_path: Path, resolution: tuple, ending_image: Path = None, breaking_news: dict = None, top_news: dict = None, total_news_count: int = 6) -> Path:
+def create_video(images: list, audio_path: Path, output_path: Path, resolution: tuple, ending_image: Path = None, breaking_news: dict = None, top_news: dict = None, total_news_count: int = 6, audio_duration: float = None, opening_image: Path = None) -> Path:
     """Create video from images and audio
     
     Args:
         breaking_news: If provided, generates breaking news style opening
         top_news: First news item for opening image headline
         total_news_count: Total number of news stories
+        audio_duration: 이미 알고 있는 오디오 길이(초) - 없으면 probe_duration으로 조회
+        opening_image: 미리 생성해 둔 오프닝 이미지 - 없으면 여기서 생성
     """
     
     # Get audio duration
-    probe_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                 "-of", "default=noprint_wrappers=1:nokey=1", str(audio_path)]
-    result = subprocess.run(probe_cmd, capture_output=True, text=True)
-    audio_duration = float(result.stdout.strip()) if result.stdout.strip() else 60.0
+    if audio_duration is None:
+        audio_duration = probe_duration(audio_path, default=60.0)
     
     print(f"    [DEBUG] Audio duration: {audio_duration:.1f}s, Images: {len(images)}")
     
-    # Build image list with opening and ending
-    all_images = []
+    # Build image timeline with opening
+    timeline = []
     
     # Shorts: 세로형, Video: 가로형
     is_shorts = resolution[0] < resolution[1]
@@ -1423,26 +1915,20 @@ def create_video(images: list, audio_path: Path, output_path: Path, resolution:
     if is_shorts:
         opening_path = output_path.parent / f"opening_{output_path.stem}.png"
         try:
-            if breaking_news:
-                generate_breaking_opening_image(opening_path, breaking_news, "vertical")
-            else:
-                # 일반 Shorts: 첫 번째 뉴스 헤드라인 강조
-                top_headline = top_news.get('title', '')[:50] if top_news else "Today's Top Stories"
-                generate_opening_image(opening_path, "vertical", top_headline=top_headline, total_count=total_news_count)
-            all_images.append(opening_path)
+            if opening_image is None:
+                opening_image = generate_shorts_opening(opening_path, breaking_news, top_news, total_news_count)
+            opening_path = opening_image
             opening_duration = 3.0  # 오프닝 3초
+            timeline.append((opening_path, opening_duration))
             print(f"    [OK] Opening image generated")
         except Exception as e:
             print(f"    [WARN] Opening image failed: {e}")
     
-    # Content images
-    all_images.extend(images)
-    
-    # Ending image
-    ending_duration = 2.0 if is_shorts else 3.0
+    # Ending image (미리 인코딩된 클립을 본편 뒤에 붙임)
+    ending_duration = ENDING_SECONDS_SHORTS if is_shorts else ENDING_SECONDS_VIDEO
+    has_ending = bool(ending_image and ending_image.exists())
     
-    if ending_image and ending_image.exists():
-        all_images.append(ending_image)
+    if has_ending:
         # 콘텐츠 이미지들은 오디오 길이에서 오프닝 시간을 뺀 만큼
         content_duration = audio_duration - opening_duration
         duration_per_image = content_duration / len(images) if images else 5.0
@@ -1450,65 +1936,22 @@ def create_video(images: list, audio_path: Path, output_path: Path, resolution:
         duration_per_image = audio_duration / len(images) if images else 5.0
         ending_duration = 0
     
-    print(f"    [DEBUG] Duration per image: {duration_per_image:.2f}s, Total images: {len(all_images)}")
-    
-    # Create concat file
-    concat_file = output_path.parent / f"concat_{output_path.stem}.txt"
-    with open(concat_file, 'w') as f:
-        for i, img in enumerate(all_images):
-            abs_path = str(img.resolve()).replace('\\', '/')
-            f.write(f"file '{abs_path}'\n")
-            
-            # Opening image
-            if opening_duration > 0 and i == 0:
-                f.write(f"duration {opening_duration}\n")
-            # Ending image (last)
-            elif ending_image and ending_image.exists() and i == len(all_images) - 1:
-                f.write(f"duration {ending_duration}\n")
-            # Content images
-            else:
-                f.write(f"duration {duration_per_image}\n")
-        abs_path = str(all_images[-1].resolve()).replace('\\', '/')
-        f.write(f"file '{abs_path}'\n")
-    
-    width, height = resolution
-    
-    # 총 길이 계산 (오디오 + 오프닝(무음) + 엔딩(무음))
-    total_duration = audio_duration + ending_duration
-    
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat", "-safe", "0", "-i", str(concat_file),
-        "-i", str(audio_path),
-        "-c:v", "libx264",
-        "-vf", f"scale={width}:{height},setsar=1:1",
-        "-c:a", "aac", "-b:a", "192k",
-        "-t", str(total_duration),
-        "-pix_fmt", "yuv420p", "-r", "30",
-        str(output_path)
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    concat_file.unlink()
+    # Content images
+    timeline.extend((img, duration_per_image) for img in images)
     
-    if result.returncode != 0:
-        raise Exception(f"FFmpeg error: {result.stderr[:500]}")
+    print(f"    [DEBUG] Duration per image: {duration_per_image:.2f}s, Total images: {len(timeline)}")
     
-    return output_path
+    # 본편 길이 = 오디오 (엔딩(무음)은 캐시된 클립으로 뒤에 붙임)
+    return render_slideshow(timeline, [audio_path], audio_duration, resolution, output_path, ending_image, ending_duration)
 
 
 def generate_description(news_list: list, is_weekly: bool = False) -> str:
     """Generate YouTube description with source links"""
-    stories = []
-    for i, n in enumerate(news_list):
-        title = n['title']
-        link = n.get('link', '')
-        if link:
-            stories.append(f"{i+1}. {title}\n{link}")
-        else:
-            stories.append(f"{i+1}. {title}")
-    
-    stories_text = "\n\n".join(stories)
+    # "1. 제목\n링크" (링크 없으면 제목만) - 한 번의 join으로 조립
+    stories_text = "\n\n".join(
+        f"{i}. {n['title']}" + (f"\n{n['link']}" if n.get('link') else "")
+        for i, n in enumerate(news_list, 1)
+    )
     
     if is_weekly:
         header = "AI News Daily | Weekly Roundup (16 Stories)"
@@ -1525,9 +1968,6 @@ def generate_description(news_list: list, is_weekly: bool = False) -> str:
 
 def generate_thumbnail(news_list: list, output_path: Path, style: str = "shorts") -> Path:
     """Generate eye-catching thumbnail: GPT Image background + Python text overlay"""
-    from PIL import Image, ImageDraw, ImageFont
-    import io
-    
     orientation = "vertical portrait" if style == "shorts" else "horizontal landscape"
     
     # 뉴스 제목들로 이미지 프롬프트 생성
@@ -1537,11 +1977,21 @@ def generate_thumbnail(news_list: list, output_path: Path, style: str = "shorts"
     # 메인 헤드라인과 서브 토픽 분리
     main_headline = titles[0] if titles else "Breaking News"
     sub_topics = ", ".join(titles[1:4]) if len(titles) > 1 else ""
+    categories = list(set([n.get('category', 'News') for n in news_list[:5]]))[:4]
+    
+    # 같은 뉴스 목록(제목)/스타일이면 배경 이미지 재사용 - 프롬프트/이미지 API 두 번 호출 생략, 텍스트 오버레이만 다시
+    bg_cache = cached_file("thumbnails", cache_key("gpt-image-1.5", "medium", style, *titles), ".png")
+    if bg_cache.exists():
+        print(f"    [CACHE] Thumbnail background")
+        with Image.open(bg_cache) as img:
+            img.load()
+        return _composite_thumbnail(img, style, titles, categories, output_path)
     
     # 1. GPT에게 뉴스 내용 기반 이미지 프롬프트 요청
-    prompt_response = requests.post(
+    prompt = ""
+    prompt_response = SESSION.post(
         f"{OPENAI_API_BASE}/chat/completions",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+        headers=OPENAI_HEADERS,
         json={
             "model": "gpt-5-mini",
             "messages": [{
@@ -1569,32 +2019,26 @@ RULES:
                 "content": f"Create image for: {main_headline}"
             }],
             "max_completion_tokens": 150,
-            "reasoning_effort": "minimal"
+            "reasoning_effort": "minimal",
+            "prompt_cache_key": "news-thumbnail"
         },
         timeout=30
     )
     
     if prompt_response.status_code == 200:
-        prompt = prompt_response.json()["choices"][0]["message"]["content"].strip()
+        prompt = json_loads(prompt_response.content)["choices"][0]["message"]["content"].strip()
     
     # 프롬프트가 비어있으면 기본값 사용
     if not prompt:
         prompt = f"Dramatic cinematic {orientation} scene, world news theme, professional photography, high contrast lighting, no text, no faces"
     
     # size 변환: gpt-image-1.5 지원 형식
-    
-    # size 변환: gpt-image-1.5 지원 형식
-    if style == "shorts":
-        img_size = "1024x1536"
-        pil_size = (1024, 1536)
-    else:
-        img_size = "1536x1024"
-        pil_size = (1536, 1024)
+    img_size = SHORTS_SIZE if style == "shorts" else VIDEO_SIZE
     
     # 2. GPT Image로 배경 생성
-    response = requests.post(
+    response = SESSION.post(
         f"{OPENAI_API_BASE}/images/generations",
-        headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+        headers=OPENAI_HEADERS,
         json={"model": "gpt-image-1.5", "prompt": prompt, "n": 1, "size": img_size, "quality": "medium"},
         timeout=120
     )
@@ -1602,38 +2046,51 @@ RULES:
     if response.status_code != 200:
         raise Exception(f"Thumbnail generation failed: {response.text}")
     
-    data = response.json()["data"][0]
+    data = json_loads(response.content)["data"][0]
     
-    # 이미지 로드
+    # 이미지 로드 (gpt-image는 기본이 b64_json이라 추가 다운로드 없음, url은 예전 모델 호환용)
     if "url" in data:
-        img_response = requests.get(data["url"], timeout=60)
-        img = Image.open(io.BytesIO(img_response.content))
+        # 응답 본문을 메모리에 따로 모으지 않고 스트림에서 바로 디코딩
+        with SESSION.get(data["url"], stream=True, timeout=60) as img_response:
+            img_response.raise_for_status()
+            img_response.raw.decode_content = True
+            img = Image.open(img_response.raw)
+            img.load()
     elif "b64_json" in data:
-        import base64
-        img_data = base64.b64decode(data["b64_json"])
-        img = Image.open(io.BytesIO(img_data))
+        img = Image.open(io.BytesIO(base64.b64decode(data["b64_json"])))
     else:
         raise Exception("Unknown image format")
     
-    # 3. 텍스트 오버레이 추가
+    # 오버레이 전 배경을 캐시 (임시 파일 + os.replace로 원자적 저장)
+    tmp_path = bg_cache.with_name(bg_cache.name + ".tmp")
+    img.save(tmp_path, "PNG")
+    os.replace(tmp_path, bg_cache)
+    
+    # 3. 텍스트 오버레이 + 저장
+    return _composite_thumbnail(img, style, titles, categories, output_path)
+
+
+def _composite_thumbnail(img, style: str, titles: list, categories: list, output_path: Path) -> Path:
+    """썸네일 배경 이미지에 텍스트 오버레이 후 JPEG 저장
+    
+    API 호출과 분리된 순수 CPU 작업 (인자가 모두 pickle 가능 - 필요하면 프로세스 풀에서도 실행 가능)
+    """
+    img = img.convert("RGB")  # 텍스트는 캐시된 마스크로 합성 - JPEG 저장 모드로 미리 맞춤
     draw = ImageDraw.Draw(img)
     
     # 폰트 설정 (시스템 폰트 사용)
     try:
         # Windows
-        font_large = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 72)
-        font_medium = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 48)
-        font_small = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 36)
+        font_large = _load_font(FONT_BOLD, 72)
+        font_medium = _load_font(FONT_BOLD, 48)
+        font_small = _load_font(FONT_REGULAR, 36)
     except:
         # 기본 폰트
         font_large = ImageFont.load_default()
         font_medium = font_large
         font_small = font_large
     
-    width, height = pil_size
-    
-    # 카테고리들 추출
-    categories = list(set([n.get('category', 'News') for n in news_list[:5]]))[:4]
+    width, height = img.size
     category_text = " • ".join(categories)
     
     if style == "shorts":
@@ -1648,32 +2105,28 @@ RULES:
         text1 = "TODAY'S"
         bbox1 = draw.textbbox((0, 0), text1, font=font_large)
         x1 = (width - (bbox1[2] - bbox1[0])) // 2
-        draw.text((x1+3, top_10_percent + 3), text1, font=font_large, fill="black")
-        draw.text((x1, top_10_percent), text1, font=font_large, fill="#FF3333")
+        _draw_shadowed_text(img, (x1, top_10_percent), text1, font_large, "#FF3333", 3)
         
         # "NEWS" (TODAY'S 아래)
         text2 = "NEWS"
         bbox2 = draw.textbbox((0, 0), text2, font=font_large)
         x2 = (width - (bbox2[2] - bbox2[0])) // 2
-        draw.text((x2+3, top_10_percent + 83), text2, font=font_large, fill="black")
-        draw.text((x2, top_10_percent + 80), text2, font=font_large, fill="white")
+        _draw_shadowed_text(img, (x2, top_10_percent + 80), text2, font_large, "white", 3)
         
         # 중앙: 날짜 (크게)
         try:
-            font_xlarge = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 96)
+            font_xlarge = _load_font(FONT_BOLD, 96)
         except:
             font_xlarge = font_large
         
         bbox_date = draw.textbbox((0, 0), today, font=font_xlarge)
         x_date = (width - (bbox_date[2] - bbox_date[0])) // 2
-        draw.text((x_date+4, height//2 - 50 + 4), today, font=font_xlarge, fill="black")
-        draw.text((x_date, height//2 - 50), today, font=font_xlarge, fill="white")
+        _draw_shadowed_text(img, (x_date, height//2 - 50), today, font_xlarge, "white", 4)
         
         # 연도
         bbox_year = draw.textbbox((0, 0), year, font=font_medium)
         x_year = (width - (bbox_year[2] - bbox_year[0])) // 2
-        draw.text((x_year+2, height//2 + 52), year, font=font_medium, fill="black")
-        draw.text((x_year, height//2 + 50), year, font=font_medium, fill="#FFD700")
+        _draw_shadowed_text(img, (x_year, height//2 + 50), year, font_medium, "#FFD700", 2)
         
         # 하단: 헤드라인 1개 (크게, 2줄로)
         top_headline = titles[0]
@@ -1696,32 +2149,29 @@ RULES:
             line2 = ""
         
         try:
-            font_headline = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 64)
+            font_headline = _load_font(FONT_BOLD, 64)
         except:
             font_headline = font_large
         
         # Line 1
         bbox_hl1 = draw.textbbox((0, 0), line1, font=font_headline)
         x_hl1 = (width - (bbox_hl1[2] - bbox_hl1[0])) // 2
-        draw.text((x_hl1+4, height - 280 + 4), line1, font=font_headline, fill="black")
-        draw.text((x_hl1, height - 280), line1, font=font_headline, fill="white")
+        _draw_shadowed_text(img, (x_hl1, height - 280), line1, font_headline, "white", 4)
         
         # Line 2
         if line2:
             bbox_hl2 = draw.textbbox((0, 0), line2, font=font_headline)
             x_hl2 = (width - (bbox_hl2[2] - bbox_hl2[0])) // 2
-            draw.text((x_hl2+4, height - 200 + 4), line2, font=font_headline, fill="black")
-            draw.text((x_hl2, height - 200), line2, font=font_headline, fill="white")
+            _draw_shadowed_text(img, (x_hl2, height - 200), line2, font_headline, "white", 4)
         
         # 카테고리
         try:
-            font_cat = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 42)
+            font_cat = _load_font(FONT_BOLD, 42)
         except:
             font_cat = font_medium
         bbox_cat = draw.textbbox((0, 0), category_text, font=font_cat)
         x_cat = (width - (bbox_cat[2] - bbox_cat[0])) // 2
-        draw.text((x_cat+2, height - 100 + 2), category_text, font=font_cat, fill="black")
-        draw.text((x_cat, height - 100), category_text, font=font_cat, fill="#FFD700")
+        _draw_shadowed_text(img, (x_cat, height - 100), category_text, font_cat, "#FFD700", 2)
         
     else:
         # Video 가로형 레이아웃 - 심플하게
@@ -1730,8 +2180,8 @@ RULES:
         
         # 큰 폰트 설정
         try:
-            font_title = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 96)  # WEEKLY NEWS용
-            font_date = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 84)   # 날짜용
+            font_title = _load_font(FONT_BOLD, 96)  # WEEKLY NEWS용
+            font_date = _load_font(FONT_BOLD, 84)   # 날짜용
         except:
             font_title = font_large
             font_date = font_large
@@ -1741,51 +2191,49 @@ RULES:
         
         # 좌측 상단: "WEEKLY" (10% 아래로)
         text1 = "WEEKLY"
-        draw.text((53, top_10_percent + 3), text1, font=font_title, fill="black")
-        draw.text((50, top_10_percent), text1, font=font_title, fill="#FF3333")
+        _draw_shadowed_text(img, (50, top_10_percent), text1, font_title, "#FF3333", 3)
         
         # 좌측 상단: "NEWS" (WEEKLY 아래)
         text2 = "NEWS"
-        draw.text((53, top_10_percent + 103), text2, font=font_title, fill="black")
-        draw.text((50, top_10_percent + 100), text2, font=font_title, fill="white")
+        _draw_shadowed_text(img, (50, top_10_percent + 100), text2, font_title, "white", 3)
         
         # 우측 하단: 날짜 (자유롭게 배치 - 우측 하단 유지)
         bbox_date = draw.textbbox((0, 0), today, font=font_date)
         x_date = width - (bbox_date[2] - bbox_date[0]) - 80
-        draw.text((x_date+3, height - 200 + 3), today, font=font_date, fill="black")
-        draw.text((x_date, height - 200), today, font=font_date, fill="white")
+        _draw_shadowed_text(img, (x_date, height - 200), today, font_date, "white", 3)
         
         bbox_year = draw.textbbox((0, 0), year, font=font_medium)
         x_year = width - (bbox_year[2] - bbox_year[0]) - 80
-        draw.text((x_year+2, height - 110 + 2), year, font=font_medium, fill="black")
-        draw.text((x_year, height - 110), year, font=font_medium, fill="#FFD700")
+        _draw_shadowed_text(img, (x_year, height - 110), year, font_medium, "#FFD700", 2)
         
         # 좌측 중앙: 헤드라인 1개 (크게)
         top_headline = titles[0][:35] + "..." if len(titles[0]) > 35 else titles[0]
         try:
-            font_headline = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 72)
+            font_headline = _load_font(FONT_BOLD, 72)
         except:
             font_headline = font_large
-        draw.text((54, int(height * 0.45) + 4), top_headline, font=font_headline, fill="black")
-        draw.text((50, int(height * 0.45)), top_headline, font=font_headline, fill="white")
+        _draw_shadowed_text(img, (50, int(height * 0.45)), top_headline, font_headline, "white", 4)
         
         # 좌측 하단: 카테고리
         try:
-            font_cat = ImageFont.truetype("C:/Windows/Fonts/arialbd.ttf", 42)
+            font_cat = _load_font(FONT_BOLD, 42)
         except:
             font_cat = font_medium
-        draw.text((52, height - 70 + 2), category_text, font=font_cat, fill="black")
-        draw.text((50, height - 70), category_text, font=font_cat, fill="#FFD700")
+        _draw_shadowed_text(img, (50, height - 70), category_text, font_cat, "#FFD700", 2)
     
     # 4. 저장 (JPEG로 압축 - YouTube 썸네일 2MB 제한)
-    img = img.convert("RGB")
-    jpg_path = Path(str(output_path).replace(".png", ".jpg"))
-    img.save(jpg_path, "JPEG", quality=85)
+    # optimize(허프만 테이블 최적화) + progressive - 같은 화질에서 파일이 더 작음, 4:2:0 서브샘플링 명시
+    jpg_path = Path(output_path).with_suffix(".jpg")
+    img.save(jpg_path, "JPEG", quality=85, optimize=True, progressive=True, subsampling=2)
     
     return jpg_path
 
 
-def main():
+def main(argv: list = None) -> dict:
+    """파이프라인 1회 실행 - summary 반환
+    
+    argv를 넘기면 한 프로세스에서 여러 번 실행 가능 (백필 등) - HTTP 세션/폰트/길이 캐시/후처리 풀을 실행 간에 재사용
+    """
     parser = argparse.ArgumentParser(description="News Shorts + Video Generator")
     parser.add_argument("--count", type=int, default=10, help="Number of news")
     parser.add_argument("--output", type=str, default="./output", help="Output directory")
@@ -1796,7 +2244,7 @@ def main():
     parser.add_argument("--breaking-news", type=str, help="Path to breaking news JSON file (single story, 60s deep dive)")
     parser.add_argument("--voice", type=str, default="marin", help="TTS voice (marin, cedar, coral, nova)")
     parser.add_argument("--dry-run", action="store_true", help="Test mode - don't save used_news")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -1809,12 +2257,17 @@ def main():
     generate_video = not args.shorts_only
     is_breaking = args.breaking_news is not None
     
+    # 엔딩 클립은 뉴스와 무관 - 캐시에 없으면 뉴스/이미지/TTS 생성 동안 미리 인코딩 (영상 조립 전 wait_postprocess에서 합류)
+    prewarm_ending_clips(
+        ([(ENDING_SHORTS, (1080, 1920), ENDING_SECONDS_SHORTS)] if generate_shorts else []) +
+        ([(ENDING_VIDEO, (1920, 1080), ENDING_SECONDS_VIDEO)] if generate_video else [])
+    )
+    
     # 1. Fetch news
     if args.breaking_news:
         # Breaking News 모드 - 단일 뉴스 딥다이브
         print(f"\n[1/8] Loading breaking news from {args.breaking_news}...")
-        with open(args.breaking_news, 'r', encoding='utf-8') as f:
-            breaking_data = json.load(f)
+        breaking_data = json_loads(Path(args.breaking_news).read_bytes())
         
         main_news = breaking_data['main']
         related = breaking_data.get('related', [])
@@ -1862,48 +2315,29 @@ def main():
         print(f"\n[2/8] Generating Shorts images (vertical, {shorts_images_per_news} per news)...")
         target_news_count = 1 if is_breaking else args.count
         
+        slot = 0
+        added_ids = set()  # 이미 추가한 뉴스 ID (리스트 안의 dict 비교 대신 set 조회)
         while len(used_news) < target_news_count and news_index < len(all_news):
-            news = all_news[news_index]
-            news_index += 1
+            # 부족한 개수만큼 다음 후보들을 동시에 처리 (실패한 뉴스는 다음 배치에서 백업 뉴스로 채움)
+            batch = []
+            for news in all_news[news_index:news_index + target_news_count - len(used_news)]:
+                slot += 1
+                batch.append((slot, news))
+                print(f"  [{slot}/{target_news_count}] {news['title'][:35]}...")
+            news_index += len(batch)
             
-            print(f"  [{len(used_news)+1}/{target_news_count}] {news['title'][:35]}...")
-            try:
-                prompts = generate_image_prompts(news, count=shorts_images_per_news, orientation="vertical")
-                news_images = []
-                for j, prompt in enumerate(prompts, 1):
-                    img_path = output_dir / f"{ts}_shorts_{len(used_news)+1}_{j}.png"
-                    try:
-                        # 1차: 일반 리얼리스틱
-                        generate_image(prompt, img_path, SHORTS_SIZE)
-                        news_images.append(img_path)
-                        print(f"    [OK] Image {j}/{shorts_images_per_news}")
-                    except ContentPolicyError:
-                        # 2차: 얼굴 없이 (뒷모습/실루엣)
-                        print(f"    [RETRY] Image {j} policy error - trying without face...")
-                        try:
-                            safe_prompts = generate_image_prompts_safe(news, shorts_images_per_news, "vertical")
-                            safe_prompt = safe_prompts[j-1] if j <= len(safe_prompts) else safe_prompts[0]
-                            generate_image(safe_prompt, img_path, SHORTS_SIZE)
-                            news_images.append(img_path)
-                            print(f"    [OK] Image {j}/{shorts_images_per_news} (no face)")
-                        except ContentPolicyError:
-                            # 3차: 추상적 이미지
-                            print(f"    [RETRY] Still failed - using abstract...")
-                            fallback_prompts = generate_image_prompts_fallback(news, shorts_images_per_news, "vertical")
-                            fallback_prompt = fallback_prompts[j-1] if j <= len(fallback_prompts) else fallback_prompts[0]
-                            generate_image(fallback_prompt, img_path, SHORTS_SIZE)
-                            news_images.append(img_path)
-                            print(f"    [OK] Image {j}/{shorts_images_per_news} (abstract)")
-                
-                shorts_images.extend(news_images)
-                if news not in used_news:
-                    used_news.append(news)
-                    
-            except ContentPolicyError as e:
-                print(f"    [SKIP] Policy violation - trying next news...")
-                skipped_news.append(news)
-            except Exception as e:
-                print(f"    [FAIL] {e}")
+            for news, outcome in render_news_batch(batch, shorts_images_per_news, "vertical", output_dir, ts, "shorts"):
+                if isinstance(outcome, ContentPolicyError):
+                    print(f"    [SKIP] Policy violation - trying next news ({news['title'][:35]}...)")
+                    skipped_news.append(news)
+                elif isinstance(outcome, Exception):
+                    print(f"    [FAIL] {news['title'][:35]}...: {outcome}")
+                else:
+                    shorts_images.extend(outcome)
+                    news_id = get_news_id(news)
+                    if news_id not in added_ids:
+                        added_ids.add(news_id)
+                        used_news.append(news)
         
         if len(used_news) < args.count:
             print(f"  [WARN] Only {len(used_news)} news processed (policy violations: {len(skipped_news)})")
@@ -1920,221 +2354,229 @@ def main():
             video_news_index = 0
             target_count = args.count
             max_per_category = (target_count + len(ALL_CATEGORIES) - 1) // len(ALL_CATEGORIES)  # 카테고리당 최대 개수
+            category_counts = {}  # 카테고리별 사용 개수 (매번 목록을 다시 세지 않음)
             
+            slot = 0
             while len(video_used_news) < target_count and video_news_index < len(all_news):
-                news = all_news[video_news_index]
-                video_news_index += 1
-                
-                # 카테고리당 max_per_category개까지만 허용
-                category = news.get('category', 'News')
-                category_count = sum(1 for n in video_used_news if n.get('category') == category)
-                if category_count >= max_per_category:
-                    continue
-                
-                print(f"  [{len(video_used_news)+1}/{target_count}] [{category}] {news['title'][:30]}...")
-                try:
-                    prompts = generate_image_prompts(news, count=3, orientation="horizontal")
-                    for j, prompt in enumerate(prompts, 1):
-                        img_path = output_dir / f"{ts}_video_{len(video_used_news)+1}_{j}.png"
-                        try:
-                            generate_image(prompt, img_path, VIDEO_SIZE)
-                            video_images.append(img_path)
-                            print(f"    [OK] Image {j}/3")
-                        except ContentPolicyError:
-                            print(f"    [RETRY] Image {j} policy error - trying without face...")
-                            try:
-                                safe_prompts = generate_image_prompts_safe(news, 3, "horizontal")
-                                safe_prompt = safe_prompts[j-1] if j <= len(safe_prompts) else safe_prompts[0]
-                                generate_image(safe_prompt, img_path, VIDEO_SIZE)
-                                video_images.append(img_path)
-                                print(f"    [OK] Image {j}/3 (no face)")
-                            except ContentPolicyError:
-                                print(f"    [RETRY] Still failed - using abstract...")
-                                fallback_prompts = generate_image_prompts_fallback(news, 3, "horizontal")
-                                fallback_prompt = fallback_prompts[j-1] if j <= len(fallback_prompts) else fallback_prompts[0]
-                                generate_image(fallback_prompt, img_path, VIDEO_SIZE)
-                                video_images.append(img_path)
-                                print(f"    [OK] Image {j}/3 (abstract)")
+                # 부족한 개수만큼 카테고리 한도 안에서 다음 후보들을 골라 동시에 처리
+                # (실패한 뉴스는 다음 배치에서 같은 카테고리의 다른 뉴스로 채움)
+                batch = []
+                pending = dict(category_counts)
+                while len(video_used_news) + len(batch) < target_count and video_news_index < len(all_news):
+                    news = all_news[video_news_index]
+                    video_news_index += 1
                     
-                    video_used_news.append(news)
+                    # 카테고리당 max_per_category개까지만 허용
+                    category = news.get('category', 'News')
+                    if pending.get(category, 0) >= max_per_category:
+                        continue
+                    pending[category] = pending.get(category, 0) + 1
                     
-                except ContentPolicyError as e:
-                    print(f"    [SKIP] Policy violation - trying next {category} news...")
-                except Exception as e:
-                    print(f"    [FAIL] {e}")
+                    slot += 1
+                    batch.append((slot, news))
+                    print(f"  [{len(video_used_news)+len(batch)}/{target_count}] [{category}] {news['title'][:30]}...")
+                
+                for news, outcome in render_news_batch(batch, 3, "horizontal", output_dir, ts, "video"):
+                    category = news.get('category', 'News')
+                    if isinstance(outcome, ContentPolicyError):
+                        print(f"    [SKIP] Policy violation - trying next {category} news...")
+                    elif isinstance(outcome, Exception):
+                        print(f"    [FAIL] {outcome}")
+                    else:
+                        video_images.extend(outcome)
+                        video_used_news.append(news)
+                        category_counts[category] = category_counts.get(category, 0) + 1
             
             news_list = video_used_news
         else:
-            # 기존 방식
-            for i, news in enumerate(news_list, 1):
+            # 기존 방식 - 뉴스끼리 독립적이므로 동시에 생성 (결과는 뉴스 순서대로 추가)
+            batch = list(enumerate(news_list, 1))
+            for i, news in batch:
                 print(f"  [{i}/{len(news_list)}] {news['title'][:35]}...")
-                try:
-                    prompts = generate_image_prompts(news, count=3, orientation="horizontal")
-                    for j, prompt in enumerate(prompts, 1):
-                        img_path = output_dir / f"{ts}_video_{i}_{j}.png"
-                        try:
-                            generate_image(prompt, img_path, VIDEO_SIZE)
-                            video_images.append(img_path)
-                            print(f"    [OK] Image {j}/3")
-                        except ContentPolicyError:
-                            print(f"    [RETRY] Image {j} policy error - trying without face...")
-                            try:
-                                safe_prompts = generate_image_prompts_safe(news, 3, "horizontal")
-                                safe_prompt = safe_prompts[j-1] if j <= len(safe_prompts) else safe_prompts[0]
-                                generate_image(safe_prompt, img_path, VIDEO_SIZE)
-                                video_images.append(img_path)
-                                print(f"    [OK] Image {j}/3 (no face)")
-                            except ContentPolicyError:
-                                print(f"    [RETRY] Still failed - using abstract...")
-                                fallback_prompts = generate_image_prompts_fallback(news, 3, "horizontal")
-                                fallback_prompt = fallback_prompts[j-1] if j <= len(fallback_prompts) else fallback_prompts[0]
-                                generate_image(fallback_prompt, img_path, VIDEO_SIZE)
-                                video_images.append(img_path)
-                                print(f"    [OK] Image {j}/3 (abstract)")
-                except ContentPolicyError as e:
-                    print(f"    [SKIP] Policy violation for video image")
-                except Exception as e:
-                    print(f"    [FAIL] {e}")
+            
+            for news, outcome in render_news_batch(batch, 3, "horizontal", output_dir, ts, "video"):
+                if isinstance(outcome, ContentPolicyError):
+                    print(f"    [SKIP] Policy violation for video image ({news['title'][:35]}...)")
+                elif isinstance(outcome, Exception):
+                    print(f"    [FAIL] {news['title'][:35]}...: {outcome}")
+                else:
+                    video_images.extend(outcome)
+    
+    # 영상 조립 전에 워터마크 후처리 완료 대기
+    wait_postprocess()
     
     results = {}
     
-    # 3-5. Generate Shorts
-    if generate_shorts and shorts_images:
-        narration_style = "breaking" if is_breaking else "short"
-        print(f"\n[4/8] Generating Shorts narration ({narration_style})...")
-        shorts_script = generate_narration_script(news_list, style=narration_style)
-        shorts_script_file = output_dir / f"{ts}_shorts_script.txt"
-        with open(shorts_script_file, 'w', encoding='utf-8') as f:
-            f.write(shorts_script)
-        print(f"  [OK] Script: {len(shorts_script.split())} words")
-        
-        print(f"\n[5/8] Generating Shorts audio...")
-        shorts_audio = output_dir / f"{ts}_shorts_audio.mp3"
-        generate_tts(shorts_script, shorts_audio, voice=args.voice)
-        print(f"  [OK] Audio saved")
-        
-        shorts_srt = generate_subtitles(shorts_script, output_dir, f"{ts}_shorts", shorts_audio)
-        
-        print(f"\n[6/8] Creating Shorts video...")
-        shorts_video = output_dir / f"{ts}_Shorts.mp4"
-        # 첫 번째 뉴스를 오프닝 이미지용으로 전달
-        top_news = news_list[0] if news_list else None
-        create_video(shorts_images, shorts_audio, shorts_video, (1080, 1920), ENDING_SHORTS, breaking_news=top_news if is_breaking else None, top_news=top_news, total_news_count=len(news_list))
-        print(f"  [OK] Shorts: {shorts_video.name}")
-        
-        # Shorts는 썸네일 업로드 불가 (영상에서 프레임 선택 방식)
-        shorts_title = f"Today's Top News - {datetime.now(US_EASTERN).strftime('%b %d')} #shorts"
-        shorts_description = generate_description(news_list)
-        
-        results["shorts"] = {
-            "video": str(shorts_video),
-            "thumbnail": None,  # Shorts는 썸네일 없음
-            "subtitles": {k: str(v) for k, v in shorts_srt.items()},
-            "title": shorts_title,
-            "description": shorts_description
-        }
-        
-        # 수동 업로드용 메타데이터 파일 생성
-        metadata_path = shorts_video.with_suffix('.txt')
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("YouTube 수동 업로드 정보 (Shorts)\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"[영상 파일]\n{shorts_video}\n\n")
-            f.write(f"[제목] (100자 제한)\n{shorts_title[:100]}\n\n")
-            f.write(f"[설명]\n{shorts_description}\n\n")
-            f.write(f"[자막 파일]\n")
-            for lang, sub_path in shorts_srt.items():
-                f.write(f"  - {lang}: {sub_path}\n")
-            f.write(f"\n[업로드 설정]\n")
-            f.write(f"  - 공개 상태: 공개 (public)\n")
-            f.write(f"  - 카테고리: 뉴스/정치 (25)\n")
-            f.write(f"  - Shorts: 자동 감지됨 (세로 영상)\n")
-        print(f"  [OK] Metadata: {metadata_path.name}")
-    
-    # 6-8. Generate Video (with synced audio)
-    if generate_video and video_images:
-        # 토요일인지 확인
-        is_saturday = datetime.now().weekday() == 5
-        
-        print(f"\n[7/8] Generating Video narration (segmented for sync)...")
-        
-        # 뉴스별 이미지 매핑 생성 (3장씩)
-        news_image_map = {}
-        img_idx = 0
-        for i in range(len(news_list)):
-            news_image_map[i] = video_images[img_idx:img_idx+3]
-            img_idx += 3
-            if img_idx > len(video_images):
-                break
-        
-        # 세그먼트별 나레이션 생성
-        audio_segments = generate_segmented_narration(news_list, style="long", is_saturday=is_saturday)
-        print(f"  [OK] Generated {len(audio_segments)} segments (intro + {len(news_list)} news + outro)")
-        
-        # 세그먼트별 TTS 생성
-        print(f"  Generating segmented audio...")
-        audio_segments = generate_segmented_audio(audio_segments, output_dir, f"{ts}_video", voice=args.voice)
-        total_duration = sum(seg["duration"] for seg in audio_segments)
-        print(f"  [OK] Total audio: {total_duration:.1f}s")
-        
-        # 오디오 병합
-        video_audio = output_dir / f"{ts}_video_audio.mp3"
-        merge_audio_segments(audio_segments, video_audio)
-        print(f"  [OK] Audio merged")
-        
-        # 스크립트 저장 (자막용)
-        video_script = " ".join([seg["text"] for seg in audio_segments])
-        video_script_file = output_dir / f"{ts}_video_script.txt"
-        with open(video_script_file, 'w', encoding='utf-8') as f:
-            f.write(video_script)
-        
-        # 자막 생성 (세그먼트 기반)
-        video_srt = generate_subtitles_from_segments(audio_segments, output_dir, f"{ts}_video")
-        
-        print(f"\n[8/8] Creating synced Video...")
-        video_file = output_dir / f"{ts}_Video.mp4"
-        create_synced_video(news_image_map, audio_segments, video_audio, video_file, (1920, 1080), ENDING_VIDEO)
-        print(f"  [OK] Video: {video_file.name}")
-        
-        # Generate Video thumbnail
-        print(f"  Generating Video thumbnail...")
-        try:
+    shorts_pool = stage_pool = None
+    shorts_render = shorts_srt_future = None
+    try:
+        # 3-5. Generate Shorts
+        if generate_shorts and shorts_images:
+            # 오프닝 이미지는 뉴스만 있으면 되므로 나레이션/TTS 동안 백그라운드에서 생성
+            shorts_pool = ThreadPoolExecutor(max_workers=2)
+            shorts_video = output_dir / f"{ts}_Shorts.mp4"
+            top_news = news_list[0] if news_list else None
+            opening_future = shorts_pool.submit(generate_shorts_opening, output_dir / f"opening_{shorts_video.stem}.png",
+                                               top_news if is_breaking else None, top_news, len(news_list))
+            
+            narration_style = "breaking" if is_breaking else "short"
+            print(f"\n[4/8] Generating Shorts narration ({narration_style})...")
+            shorts_script = generate_narration_script(news_list, style=narration_style)
+            shorts_script_file = output_dir / f"{ts}_shorts_script.txt"
+            with open(shorts_script_file, 'w', encoding='utf-8') as f:
+                f.write(shorts_script)
+            print(f"  [OK] Script: {len(shorts_script.split())} words")
+            
+            print(f"\n[5/8] Generating Shorts audio...")
+            shorts_audio = output_dir / f"{ts}_shorts_audio.mp3"
+            generate_tts(shorts_script, shorts_audio, voice=args.voice)
+            print(f"  [OK] Audio saved")
+            
+            # 자막(번역 API)은 오디오만 있으면 되므로 영상 렌더링(ffmpeg)과 동시에 진행
+            # 오디오 길이는 한 번만 조회해서 자막/렌더링에 같이 넘김
+            shorts_duration = probe_duration(shorts_audio, default=60.0)
+            shorts_srt_future = shorts_pool.submit(generate_subtitles, shorts_script, output_dir, f"{ts}_shorts",
+                                                   shorts_audio, audio_duration=shorts_duration)
+            
+            try:
+                opening_image = opening_future.result()
+            except Exception as e:
+                opening_image = None  # create_video에서 한 번 더 시도
+                print(f"  [WARN] Background opening image failed: {e}")
+            
+            print(f"\n[6/8] Creating Shorts video...")
+            # 렌더링(ffmpeg)은 백그라운드에서 - Video 나레이션/TTS/렌더링과 겹쳐서 진행하고 결과는 마지막에 수집
+            # 첫 번째 뉴스를 오프닝 이미지용으로 전달
+            shorts_render = shorts_pool.submit(create_video, shorts_images, shorts_audio, shorts_video, (1080, 1920), ENDING_SHORTS, breaking_news=top_news if is_breaking else None, top_news=top_news, total_news_count=len(news_list), audio_duration=shorts_duration, opening_image=opening_image)
+            # 실패하면 Video 단계가 끝나길 기다리지 않고 바로 로그 (예외는 아래 finally에서 수집 시 발생)
+            shorts_render.add_done_callback(report_failure)
+            
+        # 6-8. Generate Video (with synced audio)
+        if generate_video and video_images:
+            # 토요일인지 확인
+            is_saturday = datetime.now().weekday() == 5
+            
+            # 썸네일은 뉴스 목록만 필요 - 나레이션/TTS/렌더링 동안 백그라운드에서 생성
             video_thumb = output_dir / f"{ts}_video_thumbnail.jpg"
-            generate_thumbnail(news_list, video_thumb, style="video")
-            print(f"  [OK] Thumbnail: {video_thumb.name}")
-        except Exception as e:
-            video_thumb = None
-            print(f"  [WARN] Thumbnail failed: {e}")
-        
-        video_title = f"Weekly News Roundup - {datetime.now(US_EASTERN).strftime('%b %d, %Y')}"
-        video_description = generate_description(news_list, is_weekly=True)
-        
-        results["video"] = {
-            "video": str(video_file),
-            "thumbnail": str(video_thumb) if video_thumb else None,
-            "subtitles": {k: str(v) for k, v in video_srt.items()},
-            "title": video_title,
-            "description": video_description
-        }
-        
-        # 수동 업로드용 메타데이터 파일 생성
-        metadata_path = video_file.with_suffix('.txt')
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("YouTube 수동 업로드 정보 (Video)\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"[영상 파일]\n{video_file}\n\n")
-            f.write(f"[제목] (100자 제한)\n{video_title[:100]}\n\n")
-            f.write(f"[설명]\n{video_description}\n\n")
-            f.write(f"[썸네일]\n{video_thumb if video_thumb else '없음'}\n\n")
-            f.write(f"[자막 파일]\n")
-            for lang, sub_path in video_srt.items():
-                f.write(f"  - {lang}: {sub_path}\n")
-            f.write(f"\n[업로드 설정]\n")
-            f.write(f"  - 공개 상태: 공개 (public)\n")
-            f.write(f"  - 카테고리: 뉴스/정치 (25)\n")
-        print(f"  [OK] Metadata: {metadata_path.name}")
+            stage_pool = ThreadPoolExecutor(max_workers=2)
+            thumb_future = stage_pool.submit(generate_thumbnail, news_list, video_thumb, style="video")
+            
+            print(f"\n[7/8] Generating Video narration (segmented for sync)...")
+            
+            # 뉴스별 이미지 매핑 생성 (3장씩)
+            news_image_map = {}
+            img_idx = 0
+            for i in range(len(news_list)):
+                news_image_map[i] = video_images[img_idx:img_idx+3]
+                img_idx += 3
+                if img_idx > len(video_images):
+                    break
+            
+            # 세그먼트별 나레이션 생성
+            audio_segments = generate_segmented_narration(news_list, style="long", is_saturday=is_saturday)
+            print(f"  [OK] Generated {len(audio_segments)} segments (intro + {len(news_list)} news + outro)")
+            
+            # 세그먼트별 TTS 생성
+            print(f"  Generating segmented audio...")
+            audio_segments = generate_segmented_audio(audio_segments, output_dir, f"{ts}_video", voice=args.voice)
+            total_duration = sum(seg["duration"] for seg in audio_segments)
+            print(f"  [OK] Total audio: {total_duration:.1f}s")
+            
+            # 스크립트 저장 (자막용)
+            video_script = " ".join([seg["text"] for seg in audio_segments])
+            video_script_file = output_dir / f"{ts}_video_script.txt"
+            with open(video_script_file, 'w', encoding='utf-8') as f:
+                f.write(video_script)
+            
+            # 자막 생성 (세그먼트 기반) - 세그먼트 길이/텍스트만 쓰므로 영상 렌더링과 동시에 진행
+            srt_future = stage_pool.submit(generate_subtitles_from_segments, audio_segments, output_dir, f"{ts}_video")
+            
+            print(f"\n[8/8] Creating synced Video...")
+            video_file = output_dir / f"{ts}_Video.mp4"
+            # 오디오는 별도 병합 없이 세그먼트 파일을 렌더링에서 바로 이어 붙임
+            create_synced_video(news_image_map, audio_segments, None, video_file, (1920, 1080), ENDING_VIDEO)
+            discard_files(seg["audio_path"] for seg in audio_segments)
+            print(f"  [OK] Video: {video_file.name}")
+            video_srt = srt_future.result()
+            
+            # Generate Video thumbnail
+            print(f"  Generating Video thumbnail...")
+            try:
+                thumb_future.result()
+                print(f"  [OK] Thumbnail: {video_thumb.name}")
+            except Exception as e:
+                video_thumb = None
+                print(f"  [WARN] Thumbnail failed: {e}")
+            
+            video_title = f"Weekly News Roundup - {datetime.now(US_EASTERN).strftime('%b %d, %Y')}"
+            video_description = generate_description(news_list, is_weekly=True)
+            
+            results["video"] = {
+                "video": str(video_file),
+                "thumbnail": str(video_thumb) if video_thumb else None,
+                "subtitles": {k: str(v) for k, v in video_srt.items()},
+                "title": video_title,
+                "description": video_description
+            }
+            
+            # 수동 업로드용 메타데이터 파일 생성
+            metadata_path = video_file.with_suffix('.txt')
+            with open(metadata_path, 'w', encoding='utf-8') as f:
+                f.write("=" * 60 + "\n")
+                f.write("YouTube 수동 업로드 정보 (Video)\n")
+                f.write("=" * 60 + "\n\n")
+                f.write(f"[영상 파일]\n{video_file}\n\n")
+                f.write(f"[제목] (100자 제한)\n{video_title[:100]}\n\n")
+                f.write(f"[설명]\n{video_description}\n\n")
+                f.write(f"[썸네일]\n{video_thumb if video_thumb else '없음'}\n\n")
+                f.write(f"[자막 파일]\n")
+                for lang, sub_path in video_srt.items():
+                    f.write(f"  - {lang}: {sub_path}\n")
+                f.write(f"\n[업로드 설정]\n")
+                f.write(f"  - 공개 상태: 공개 (public)\n")
+                f.write(f"  - 카테고리: 뉴스/정치 (25)\n")
+            print(f"  [OK] Metadata: {metadata_path.name}")
+    finally:
+        # Video 단계가 실패해도 백그라운드 Shorts 렌더링/자막은 끝까지 수집 (메타데이터/결과 유실 방지) + 풀 정리
+        try:
+            if shorts_render is not None:
+                shorts_render.result()
+                shorts_srt = shorts_srt_future.result()
+                print(f"  [OK] Shorts: {shorts_video.name}")
+                
+                # Shorts는 썸네일 업로드 불가 (영상에서 프레임 선택 방식)
+                shorts_title = f"Today's Top News - {datetime.now(US_EASTERN).strftime('%b %d')} #shorts"
+                shorts_description = generate_description(news_list)
+                
+                results["shorts"] = {
+                    "video": str(shorts_video),
+                    "thumbnail": None,  # Shorts는 썸네일 없음
+                    "subtitles": {k: str(v) for k, v in shorts_srt.items()},
+                    "title": shorts_title,
+                    "description": shorts_description
+                }
+                
+                # 수동 업로드용 메타데이터 파일 생성
+                metadata_path = shorts_video.with_suffix('.txt')
+                with open(metadata_path, 'w', encoding='utf-8') as f:
+                    f.write("=" * 60 + "\n")
+                    f.write("YouTube 수동 업로드 정보 (Shorts)\n")
+                    f.write("=" * 60 + "\n\n")
+                    f.write(f"[영상 파일]\n{shorts_video}\n\n")
+                    f.write(f"[제목] (100자 제한)\n{shorts_title[:100]}\n\n")
+                    f.write(f"[설명]\n{shorts_description}\n\n")
+                    f.write(f"[자막 파일]\n")
+                    for lang, sub_path in shorts_srt.items():
+                        f.write(f"  - {lang}: {sub_path}\n")
+                    f.write(f"\n[업로드 설정]\n")
+                    f.write(f"  - 공개 상태: 공개 (public)\n")
+                    f.write(f"  - 카테고리: 뉴스/정치 (25)\n")
+                    f.write(f"  - Shorts: 자동 감지됨 (세로 영상)\n")
+                print(f"  [OK] Metadata: {metadata_path.name}")
+        finally:
+            for pool in (stage_pool, shorts_pool):
+                if pool is not None:
+                    pool.shutdown()
     
     # Save summary
     summary = {
@@ -2151,10 +2593,8 @@ def main():
     # 사용한 뉴스 저장 (중복 방지) - RSS 사용 시 news_rss.py에서 저장하므로 스킵
     if not args.use_rss:
         news_type = "weekly" if args.by_category else "daily"
-        used_news = load_used_news(news_type)
-        for news in news_list:
-            used_news.add(get_news_id(news))
-        save_used_news(used_news, news_type)
+        # 기록 순서 = 영상에 나온 순서 (로그에 없는 ID만 추가됨)
+        save_used_news([get_news_id(news) for news in news_list], news_type)
     
     print(f"\n{'='*60}")
     print(f"[OK] Complete!")
@@ -2163,6 +2603,8 @@ def main():
     if "video" in results:
         print(f"[OK] Video: {results['video']['video']}")
     print(f"{'='*60}")
+    
+    return summary
 
 
 if __name__ == "__main__":
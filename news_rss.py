@@ -42,15 +42,23 @@ Log:
 
 import feedparser
 import hashlib
-import json
+import re
 import random
 import sys
 import io
 import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
+from time import mktime
 from typing import List, Dict, Optional
 
+from news_store import json_loads, json_dumps, read_used_log, append_used_log
+
 # Windows 콘솔 UTF-8 출력 설정 (직접 실행 시에만)
 if sys.platform == 'win32' and sys.stdout and hasattr(sys.stdout, 'buffer'):
     try:
@@ -135,8 +143,10 @@ CATEGORY_NAMES = {
 }
 
 # Used news tracking
-USED_NEWS_FILE_RSS_DAILY = Path(__file__).parent / "used_news_rss_daily.json"
-USED_NEWS_FILE_RSS_WEEKLY = Path(__file__).parent / "used_news_rss_weekly.json"
+# daily/weekly: 한 줄에 ID 하나씩 append-only 로그 (기존 .json은 첫 로드 시 자동 변환)
+# breaking: daily_counts/daily_titles를 함께 저장하므로 JSON 유지
+USED_NEWS_FILE_RSS_DAILY = Path(__file__).parent / "used_news_rss_daily.ndjson"
+USED_NEWS_FILE_RSS_WEEKLY = Path(__file__).parent / "used_news_rss_weekly.ndjson"
 USED_NEWS_FILE_RSS_BREAKING = Path(__file__).parent / "used_news_rss_breaking.json"
 
 # Breaking news daily limit
@@ -207,16 +217,25 @@ TOPIC_KEYWORDS = {
 # UTILITY FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=4096)
 def get_news_id(title: str) -> str:
-    """Generate unique ID from title"""
-    return hashlib.md5(title.encode()).hexdigest()[:16]
+    """Generate unique ID from title (같은 제목은 필터/선택/저장 단계에서 다시 해시하지 않음)"""
+    return hashlib.md5(title.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+# 제목 정규화/설명 정리용 정규식 (사전 컴파일)
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
-    """Normalize title for comparison (lowercase, remove punctuation)"""
-    import re
+    """Normalize title for comparison (lowercase, remove punctuation)
+    
+    titles_match가 기사 쌍마다 호출하므로 같은 제목은 한 번만 정규화
+    """
     title = title.lower()
-    title = re.sub(r'[^\w\s]', '', title)
+    title = PUNCTUATION_RE.sub('', title)
     return ' '.join(title.split())
 
 
@@ -424,38 +443,53 @@ def group_news_by_similarity(news_list: List[Dict], similarity_threshold: float
 
 def load_used_news(news_type: str = "daily") -> set:
     """Load used news IDs"""
-    if news_type == "daily":
-        file_path = USED_NEWS_FILE_RSS_DAILY
-    elif news_type == "weekly":
-        file_path = USED_NEWS_FILE_RSS_WEEKLY
-    else:  # breaking
-        file_path = USED_NEWS_FILE_RSS_BREAKING
+    if news_type == "breaking":
+        if USED_NEWS_FILE_RSS_BREAKING.exists():
+            return set(json_loads(USED_NEWS_FILE_RSS_BREAKING.read_bytes()).get("used", []))
+        return set()
     
-    if file_path.exists():
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return set(data.get("used", []))
-    return set()
+    file_path = USED_NEWS_FILE_RSS_DAILY if news_type == "daily" else USED_NEWS_FILE_RSS_WEEKLY
+    return set(read_used_log(file_path))
 
 
-def save_used_news(used: set, news_type: str = "daily", max_keep: int = 500):
-    """Save used news IDs"""
-    if news_type == "daily":
-        file_path = USED_NEWS_FILE_RSS_DAILY
-    elif news_type == "weekly":
-        file_path = USED_NEWS_FILE_RSS_WEEKLY
-    else:  # breaking
+def save_used_news(used: List[str], news_type: str = "daily", max_keep: int = 500):
+    """Save used news IDs - 이번에 고른 ID를 선택 순서대로 넘김, 새 ID만 append (로그가 2배 넘게 커지면 최근 max_keep개로 압축)"""
+    if news_type == "breaking":
+        # 파일의 기록 순서를 유지하고 새 ID만 뒤에 붙인 뒤 최근 max_keep개 유지
+        # (breaking 파일의 daily_counts/daily_titles 등 다른 키도 보존)
         file_path = USED_NEWS_FILE_RSS_BREAKING
+        data = json_loads(file_path.read_bytes()) if file_path.exists() else {}
+        logged = data.get("used", [])
+        known = set(logged)
+        data["used"] = (logged + [news_id for news_id in dict.fromkeys(used) if news_id not in known])[-max_keep:]
+        file_path.write_bytes(json_dumps(data))
+        return
     
-    used_list = list(used)[-max_keep:]
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump({"used": used_list}, f)
+    file_path = USED_NEWS_FILE_RSS_DAILY if news_type == "daily" else USED_NEWS_FILE_RSS_WEEKLY
+    append_used_log(file_path, used, max_keep)
+
+
+FEED_TIMEOUT = 15  # feedparser.parse(url)는 타임아웃이 없어 피드 하나가 멈추면 전체가 멈춤
+FEED_WORKERS = 16
+
+# RSS 요청 세션 (keep-alive - BBC 등 같은 호스트 피드가 여러 개) + 연결 실패만 재시도
+# 호스트당 풀 크기 = 워커 수 - 작으면 같은 호스트 동시 요청이 끝날 때 연결을 버려서("pool is full") keep-alive 효과가 사라짐
+FEED_SESSION = requests.Session()
+FEED_SESSION.headers["User-Agent"] = feedparser.USER_AGENT
+FEED_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=FEED_WORKERS,
+                                           max_retries=Retry(total=2, read=0, backoff_factor=0.5)))
+FEED_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=FEED_WORKERS,
+                                          max_retries=Retry(total=2, read=0, backoff_factor=0.5)))
 
 
 def parse_feed(url: str, source_name: str, category: str) -> List[Dict]:
     """Parse a single RSS feed (keeps original order = Top news first)"""
     try:
-        feed = feedparser.parse(url)
+        response = FEED_SESSION.get(url, timeout=FEED_TIMEOUT)
+        response.raise_for_status()
+        # 본문만 넘기면 HTTP charset을 잃으므로 응답 헤더도 전달 (feedparser는 소문자 키로 조회)
+        feed = feedparser.parse(response.content,
+                                response_headers={k.lower(): v for k, v in response.headers.items()})
         news_items = []
         
         for entry in feed.entries[:10]:  # Max 10 per feed
@@ -466,15 +500,13 @@ def parse_feed(url: str, source_name: str, category: str) -> List[Dict]:
             # Get publish time (for reference, not sorting)
             published = entry.get('published_parsed') or entry.get('updated_parsed')
             if published:
-                from time import mktime
                 pub_timestamp = mktime(published)
             else:
                 pub_timestamp = 0
             
             # Clean description (remove HTML tags)
             if description:
-                import re
-                description = re.sub(r'<[^>]+>', '', description).strip()
+                description = HTML_TAG_RE.sub('', description).strip()
                 description = description[:500]  # Limit length
             
             if title and len(title) > 20:
@@ -494,6 +526,17 @@ def parse_feed(url: str, source_name: str, category: str) -> List[Dict]:
         return []
 
 
+def parse_feeds(categories: List[str]) -> List[tuple]:
+    """카테고리들의 모든 피드를 동시에 가져옴 - [(category, source_name, items), ...] (RSS_FEEDS 순서 유지)
+    
+    피드 요청은 서로 독립적인 네트워크 대기라서 전체 시간 = 가장 느린 피드
+    """
+    jobs = [(category, source_name, url) for category in categories for source_name, url in RSS_FEEDS[category]]
+    with ThreadPoolExecutor(max_workers=FEED_WORKERS) as ex:
+        results = ex.map(lambda job: parse_feed(job[2], job[1], job[0]), jobs)
+        return [(category, source_name, items) for (category, source_name, _), items in zip(jobs, results)]
+
+
 # =============================================================================
 # MAIN FETCH FUNCTIONS
 # =============================================================================
@@ -514,29 +557,24 @@ def fetch_rss_news(count: int = 8, news_type: str = "daily", dry_run: bool = Fal
     random.shuffle(categories)  # 카테고리 순서 랜덤화
     
     # Collect news from each category (RSS 원본 순서 유지 = Top 뉴스 우선)
-    for category in categories:
-        feeds = RSS_FEEDS[category]
-        
-        for source_name, url in feeds:
-            items = parse_feed(url, source_name, category)
+    for category, source_name, items in parse_feeds(categories):
+        for item in items:
+            news_id = get_news_id(item['title'])
             
-            for item in items:
-                news_id = get_news_id(item['title'])
-                
-                # 1. 이미 사용한 뉴스 스킵
-                if news_id in used_news:
-                    continue
-                
-                # 2. 지역/단체 한정 기사 스킵
-                if is_local_news(item['title'], item.get('description', '')):
-                    continue
-                
-                # 3. 유사 기사 스킵
-                if is_similar_news(item['title'], all_titles):
-                    continue
-                
-                all_news.append(item)
-                all_titles.append(item['title'])
+            # 1. 이미 사용한 뉴스 스킵
+            if news_id in used_news:
+                continue
+            
+            # 2. 지역/단체 한정 기사 스킵
+            if is_local_news(item['title'], item.get('description', '')):
+                continue
+            
+            # 3. 유사 기사 스킵
+            if is_similar_news(item['title'], all_titles):
+                continue
+            
+            all_news.append(item)
+            all_titles.append(item['title'])
     
     # RSS 피드 원본 순서 유지 (Top 뉴스 우선) - 시간순 정렬 제거
     print(f"  [INFO] Collected {len(all_news)} articles (Top news order)...")
@@ -580,11 +618,9 @@ def fetch_rss_news(count: int = 8, news_type: str = "daily", dry_run: bool = Fal
     # 카테고리별로 그룹화 + 비슷한 기사끼리 클러스터링
     selected = group_news_by_similarity(selected)
     
-    # Save used news
-    for news in selected:
-        used_news.add(get_news_id(news['title']))
+    # Save used news - 기록 순서 = 이번 실행의 선택 순서 (로그에 없는 ID만 추가됨)
     if not dry_run:
-        save_used_news(used_news, news_type)
+        save_used_news([get_news_id(news['title']) for news in selected], news_type)
     else:
         print("  [DRY RUN] Skipping save_used_news")
     
@@ -610,29 +646,24 @@ def fetch_rss_news_by_category(count: int = 16, news_type: str = "weekly", dry_r
     per_category = (count + len(categories) - 1) // len(categories)  # Ceiling division
     
     # 1차: 모든 카테고리에서 뉴스 수집 (RSS 원본 순서 유지 = Top 뉴스 우선)
-    for category in categories:
-        feeds = RSS_FEEDS[category]
-        
-        for source_name, url in feeds:
-            items = parse_feed(url, source_name, category)
+    for category, source_name, items in parse_feeds(categories):
+        for item in items:
+            news_id = get_news_id(item['title'])
             
-            for item in items:
-                news_id = get_news_id(item['title'])
-                
-                # 1. 이미 사용한 뉴스 스킵
-                if news_id in used_news:
-                    continue
-                
-                # 2. 지역/단체 한정 기사 스킵
-                if is_local_news(item['title'], item.get('description', '')):
-                    continue
-                
-                # 3. 유사 기사 스킵 (전체 기준)
-                if is_similar_news(item['title'], all_titles):
-                    continue
-                
-                all_news.append(item)
-                all_titles.append(item['title'])
+            # 1. 이미 사용한 뉴스 스킵
+            if news_id in used_news:
+                continue
+            
+            # 2. 지역/단체 한정 기사 스킵
+            if is_local_news(item['title'], item.get('description', '')):
+                continue
+            
+            # 3. 유사 기사 스킵 (전체 기준)
+            if is_similar_news(item['title'], all_titles):
+                continue
+            
+            all_news.append(item)
+            all_titles.append(item['title'])
     
     # RSS 피드 원본 순서 유지 (Top 뉴스 우선) - 시간순 정렬 제거
     print(f"  [INFO] Collected {len(all_news)} articles (Top news order)...")
@@ -680,11 +711,9 @@ def fetch_rss_news_by_category(count: int = 16, news_type: str = "weekly", dry_r
     # 카테고리별로 그룹화 + 비슷한 기사끼리 클러스터링
     selected = group_news_by_similarity(selected)
     
-    # Save used news
-    for news in selected:
-        used_news.add(get_news_id(news['title']))
+    # Save used news - 기록 순서 = 이번 실행의 선택 순서 (로그에 없는 ID만 추가됨)
     if not dry_run:
-        save_used_news(used_news, news_type)
+        save_used_news([get_news_id(news['title']) for news in selected], news_type)
     else:
         print("  [DRY RUN] Skipping save_used_news")
     
@@ -701,8 +730,7 @@ def get_today_breaking_count() -> int:
     if not USED_NEWS_FILE_RSS_BREAKING.exists():
         return 0
     
-    with open(USED_NEWS_FILE_RSS_BREAKING, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = json_loads(USED_NEWS_FILE_RSS_BREAKING.read_bytes())
     
     today = datetime.now().strftime('%Y-%m-%d')
     daily_counts = data.get('daily_counts', {})
@@ -714,8 +742,7 @@ def get_today_breaking_titles() -> List[str]:
     if not USED_NEWS_FILE_RSS_BREAKING.exists():
         return []
     
-    with open(USED_NEWS_FILE_RSS_BREAKING, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = json_loads(USED_NEWS_FILE_RSS_BREAKING.read_bytes())
     
     today = datetime.now().strftime('%Y-%m-%d')
     daily_titles = data.get('daily_titles', {})
@@ -726,8 +753,7 @@ def increment_today_breaking_count(title: str = ""):
     """Increment today's breaking news count and save title"""
     data = {}
     if USED_NEWS_FILE_RSS_BREAKING.exists():
-        with open(USED_NEWS_FILE_RSS_BREAKING, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_loads(USED_NEWS_FILE_RSS_BREAKING.read_bytes())
     
     today = datetime.now().strftime('%Y-%m-%d')
     daily_counts = data.get('daily_counts', {})
@@ -749,8 +775,7 @@ def increment_today_breaking_count(title: str = ""):
     data['daily_counts'] = daily_counts
     data['daily_titles'] = daily_titles
     
-    with open(USED_NEWS_FILE_RSS_BREAKING, 'w', encoding='utf-8') as f:
-        json.dump(data, f)
+    USED_NEWS_FILE_RSS_BREAKING.write_bytes(json_dumps(data))
 
 
 def detect_breaking_news(min_sources: int = 8) -> Optional[Dict]:
@@ -772,11 +797,7 @@ def detect_breaking_news(min_sources: int = 8) -> Optional[Dict]:
     used_breaking = load_used_news("breaking")
     
     # Collect all news from all feeds
-    all_news = []
-    for category, feeds in RSS_FEEDS.items():
-        for source_name, url in feeds:
-            items = parse_feed(url, source_name, category)
-            all_news.extend(items)
+    all_news = [item for _, _, items in parse_feeds(list(RSS_FEEDS)) for item in items]
     
     print(f"  [INFO] Scanned {len(all_news)} articles from all feeds")
     
@@ -834,8 +855,7 @@ def detect_breaking_news(min_sources: int = 8) -> Optional[Dict]:
             print(f"  [GENERATE] Proceeding with breaking news generation...")
             
             # Mark as used
-            used_breaking.add(get_news_id(news['title']))
-            save_used_news(used_breaking, "breaking")
+            save_used_news([get_news_id(news['title'])], "breaking")
             
             # Increment daily count and save title
             increment_today_breaking_count(news['title'])
@@ -856,23 +876,17 @@ def fetch_breaking_news_details(breaking_news: Dict) -> List[Dict]:
     related = [breaking_news]
     all_titles = [breaking_news['title']]
     
-    # Scan all feeds for related news
-    for category, feeds in RSS_FEEDS.items():
-        for source_name, url in feeds:
-            items = parse_feed(url, source_name, category)
-            
-            for item in items:
-                if titles_match(item['title'], breaking_news['title'], threshold=0.3):
-                    if not is_similar_news(item['title'], all_titles, threshold=0.7):
-                        related.append(item)
-                        all_titles.append(item['title'])
-                        print(f"  [+] {source_name}: {item['title'][:40]}...")
-                        
-                        if len(related) >= 5:  # Max 5 sources
-                            break
-            
-            if len(related) >= 5:
-                break
+    # Scan all feeds for related news (피드는 동시에 가져오고 검사는 RSS_FEEDS 순서대로)
+    for category, source_name, items in parse_feeds(list(RSS_FEEDS)):
+        for item in items:
+            if titles_match(item['title'], breaking_news['title'], threshold=0.3):
+                if not is_similar_news(item['title'], all_titles, threshold=0.7):
+                    related.append(item)
+                    all_titles.append(item['title'])
+                    print(f"  [+] {source_name}: {item['title'][:40]}...")
+                    
+                    if len(related) >= 5:  # Max 5 sources
+                        break
         
         if len(related) >= 5:
             break
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+공용 JSON 헬퍼 + used news 로그 (news_dual.py / news_rss.py / add_timeout.py)
+=============================================================================
+
+- json_loads / json_dumps: orjson 있으면 사용 (파싱/직렬화 2-5배 빠름), 없으면 표준 json
+- read_used_log / append_used_log: 사용한 뉴스 ID를 한 줄에 하나씩 기록하는 append 전용 로그
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+# 모듈 이름에 None을 넣지 않고 플래그로 구분 (mypy/mypyc가 모듈 타입을 그대로 유지)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_loads(buf: bytes) -> Any:
+    """JSON 파싱 (orjson 우선)"""
+    return orjson.loads(buf) if HAS_ORJSON else json.loads(buf)
+
+
+def json_dumps(data: object, indent: bool = False) -> bytes:
+    """JSON 직렬화 → UTF-8 bytes (orjson 우선, indent=True면 2칸 들여쓰기)"""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+# 로그 파일별 ID 목록 (같은 실행 안에서는 파일을 다시 읽지 않음 - 저장 시 함께 갱신)
+_USED_CACHE: dict[Path, list[str]] = {}
+
+
+def _write_ids(file_path: Path, ids: list[str]) -> None:
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    tmp_path.write_bytes("".join(f"{news_id}\n" for news_id in ids).encode("utf-8"))
+    os.replace(tmp_path, file_path)
+
+
+def _load_used_log(file_path: Path) -> list[str]:
+    if not file_path.exists():
+        # 기존 {"used": [...]} JSON → 로그로 변환
+        legacy_path = file_path.with_suffix(".json")
+        ids: list[str] = []
+        if legacy_path.exists():
+            try:
+                ids = json_loads(legacy_path.read_bytes()).get("used", [])
+            except Exception:
+                pass  # 빈 파일/손상 시 무시
+        if ids:
+            _write_ids(file_path, ids)
+        return ids
+
+    with open(file_path, "rb") as fh:
+        return [line.rstrip().decode("utf-8") for line in fh if line.strip()]
+
+
+def read_used_log(file_path: Path) -> list[str]:
+    """used news 로그 읽기 (기록 순서 유지)"""
+    if file_path not in _USED_CACHE:
+        _USED_CACHE[file_path] = _load_used_log(file_path)
+    return _USED_CACHE[file_path]
+
+
+def append_used_log(file_path: Path, used: Iterable[str], max_keep: int) -> None:
+    """새 ID만 넘겨준 순서대로 append (로그가 max_keep의 2배를 넘으면 최근 max_keep개로 압축)"""
+    logged = read_used_log(file_path)
+    known = set(logged)
+    new_ids = [news_id for news_id in dict.fromkeys(used) if news_id not in known]
+
+    if len(logged) + len(new_ids) > 2 * max_keep:
+        # 압축: 기록 순서 기준 최근 max_keep개만 유지
+        keep = (logged + new_ids)[-max_keep:]
+        _write_ids(file_path, keep)
+        _USED_CACHE[file_path] = keep
+    elif new_ids:
+        with open(file_path, "ab") as fh:
+            fh.write("".join(f"{news_id}\n" for news_id in new_ids).encode("utf-8"))
+        _USED_CACHE[file_path] = logged + new_ids
@@ -33,7 +33,6 @@ import subprocess
 import sys
 import json
 import atexit
-import requests
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -45,6 +44,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 load_dotenv()
 
 from news_rss import detect_breaking_news, fetch_breaking_news_details
+from news_store import json_loads
+from http_session import backoff_session
 
 KST = ZoneInfo("Asia/Seoul")
 LOG_FILE = Path(__file__).parent / "logs" / f"breaking_{datetime.now(KST).strftime('%Y%m%d')}.log"
@@ -57,6 +58,9 @@ LOCK_FILE = Path(__file__).parent / "breaking.lock"
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 OPENAI_API_BASE = "https://api.openai.com/v1"
 
+# OpenAI 세션 (keep-alive) - 429/5xx/타임아웃은 BackoffSession이 재시도 (news_dual과 같은 정책)
+SESSION = backoff_session(pool_size=2)
+
 
 def log(msg):
     """Log to console and file"""
@@ -106,7 +110,7 @@ Respond in JSON format:
 {{"is_breaking": true/false, "reason": "brief explanation"}}"""
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{OPENAI_API_BASE}/chat/completions",
             headers={
                 "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -122,7 +126,7 @@ Respond in JSON format:
         )
         
         if response.status_code == 200:
-            content = response.json()["choices"][0]["message"]["content"]
+            content = json_loads(response.content)["choices"][0]["message"]["content"]
             # Parse JSON from response
             content = content.strip()
             if content.startswith("```"):
@@ -130,7 +134,7 @@ Respond in JSON format:
                 if content.startswith("json"):
                     content = content[4:]
             
-            result = json.loads(content)
+            result = json_loads(content)
             log(f"[GPT] Decision: {'✓ BREAKING' if result['is_breaking'] else '✗ NOT BREAKING'}")
             log(f"[GPT] Reason: {result['reason']}")
             return result
@@ -325,8 +329,7 @@ def main():
             temp_file.unlink()
         sys.exit(1)
     
-    with open(summaries[0], 'r', encoding='utf-8') as f:
-        summary = json.load(f)
+    summary = json_loads(summaries[0].read_bytes())
     
     # [4/4] Upload to YouTube
     success = upload_shorts(summary)
@@ -1,3 +1,4 @@
 set N8N_USER_FOLDER=D:\workspace\news\n8n_data
 set NODES_EXCLUDE=[]
+set PYTHONIOENCODING=utf-8
 n8n
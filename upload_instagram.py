@@ -27,9 +27,9 @@ import sys
 import json
 import time
 import argparse
-import requests
 from pathlib import Path
 from dotenv import load_dotenv
+from http_session import backoff_session
 
 load_dotenv()
 
@@ -41,6 +41,10 @@ INSTAGRAM_ACCESS_TOKEN = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
 INSTAGRAM_ACCOUNT_ID = os.environ.get("INSTAGRAM_ACCOUNT_ID")
 GRAPH_API_URL = "https://graph.facebook.com/v18.0"
 
+# Graph API 세션 재사용 (keep-alive - 상태 폴링이 최대 30번 같은 호스트로 나감)
+# 429/5xx/타임아웃 재시도는 다른 스크립트와 같은 BackoffSession 정책 (게시 요청만 재시도 안 함)
+SESSION = backoff_session(pool_size=4)
+
 # =============================================================================
 # INSTAGRAM UPLOAD FUNCTIONS
 # =============================================================================
@@ -48,7 +52,7 @@ GRAPH_API_URL = "https://graph.facebook.com/v18.0"
 def get_instagram_account_id(access_token: str) -> str:
     """Get Instagram Business Account ID from Facebook Page"""
     # First get Facebook Pages
-    response = requests.get(
+    response = SESSION.get(
         f"{GRAPH_API_URL}/me/accounts",
         params={"access_token": access_token}
     )
@@ -64,7 +68,7 @@ def get_instagram_account_id(access_token: str) -> str:
     page_id = pages[0]["id"]
     page_token = pages[0]["access_token"]
     
-    response = requests.get(
+    response = SESSION.get(
         f"{GRAPH_API_URL}/{page_id}",
         params={
             "fields": "instagram_business_account",
@@ -110,7 +114,7 @@ def upload_reel(video_url: str, caption: str,
     if cover_url:
         container_params["cover_url"] = cover_url
     
-    response = requests.post(
+    response = SESSION.post(
         f"{GRAPH_API_URL}/{INSTAGRAM_ACCOUNT_ID}/media",
         data=container_params
     )
@@ -125,7 +129,7 @@ def upload_reel(video_url: str, caption: str,
     print(f"[2/3] Waiting for video processing...")
     max_attempts = 30
     for attempt in range(max_attempts):
-        response = requests.get(
+        response = SESSION.get(
             f"{GRAPH_API_URL}/{container_id}",
             params={
                 "fields": "status_code,status",
@@ -152,12 +156,13 @@ def upload_reel(video_url: str, caption: str,
     
     # Step 3: Publish the reel
     print(f"[3/3] Publishing reel...")
-    response = requests.post(
+    response = SESSION.post(
         f"{GRAPH_API_URL}/{INSTAGRAM_ACCOUNT_ID}/media_publish",
         data={
             "creation_id": container_id,
             "access_token": INSTAGRAM_ACCESS_TOKEN
-        }
+        },
+        max_attempts=1  # 게시는 멱등이 아님 - 5xx 후 재시도하면 같은 릴이 두 번 올라갈 수 있음
     )
     
     if response.status_code != 200: